@@ -5,7 +5,7 @@ from broker import MessageBroker
 
 
 # mccole: message
-@dataclass
+@dataclass(slots=True)
 class AckMessage(Message):
     """Message that requires acknowledgment."""
 
@@ -19,6 +19,8 @@ class AckMessage(Message):
 class AckBroker(MessageBroker):
     """Broker with acknowledgment support."""
 
+    __slots__ = ("ack_timeout", "pending_acks", "next_ack_id")
+
     def __init__(self, env: Environment, ack_timeout: float = 10.0):
         super().__init__(env)
         self.ack_timeout = ack_timeout
@@ -28,7 +30,7 @@ class AckBroker(MessageBroker):
     # mccole: /broker
 
     # mccole: publish
-    async def publish(self, message: Message):
+    async def publish(self, message: Message) -> None:
         """Publish with acknowledgment."""
         self.num_published += 1
         queues = self.topics.get(message.topic, [])
@@ -53,7 +55,7 @@ class AckBroker(MessageBroker):
                 self.env.now + self.ack_timeout, lambda aid=ack_id: self._check_ack(aid)
             )
 
-    def _check_ack(self, ack_id: int):
+    def _check_ack(self, ack_id: int) -> None:
         """Check if message needs redelivery (called by scheduler)."""
         if ack_id in self.pending_acks:
             msg, _, queue = self.pending_acks[ack_id]
@@ -66,7 +68,7 @@ class AckBroker(MessageBroker):
     # mccole: /publish
 
     # mccole: acknowledge
-    def acknowledge(self, ack_id: int):
+    def acknowledge(self, ack_id: int) -> None:
         """Acknowledge receipt of a message."""
         if ack_id in self.pending_acks:
             del self.pending_acks[ack_id]
@@ -1,23 +1,44 @@
+from array import array
 from asimpy import Environment, Queue
 from collections import defaultdict
 
 from message import Message
 
+# Indices into the packed statistics array.
+PUBLISHED, DELIVERED, DROPPED = 0, 1, 2
+
 
 # mccole: backpressure
 class BackpressureBroker:
     """A message broker with backpressure support."""
 
+    __slots__ = ("env", "max_queue_size", "topics", "_stats")
+
     def __init__(self, env: Environment, max_queue_size: int = 10):
         self.env = env
         self.max_queue_size = max_queue_size
         self.topics: dict[str, list[Queue]] = defaultdict(list)
-        self.num_published = 0
-        self.num_delivered = 0
-        self.num_dropped = 0
+        # Pack the counters into one array of C longs so that
+        # incrementing them never allocates a new Python int.
+        self._stats = array("q", [0, 0, 0])
 
     # mccole: /backpressure
 
+    # mccole: stats
+    @property
+    def num_published(self) -> int:
+        return self._stats[PUBLISHED]
+
+    @property
+    def num_delivered(self) -> int:
+        return self._stats[DELIVERED]
+
+    @property
+    def num_dropped(self) -> int:
+        return self._stats[DROPPED]
+
+    # mccole: /stats
+
     # mccole: subscribe
     def subscribe(self, topic: str) -> Queue:
         """Create a bounded queue for a subscriber to a topic."""
@@ -34,18 +55,33 @@ class BackpressureBroker:
         Returns True if message was delivered to all subscribers,
         False if any queue was full and message was dropped.
         """
-        self.num_published += 1
+        stats = self._stats
+        stats[PUBLISHED] += 1
         queues = self.topics.get(message.topic, [])
 
         all_delivered = True
         for queue in queues:
             if not queue.is_full():
                 await queue.put(message)
-                self.num_delivered += 1
+                stats[DELIVERED] += 1
             else:
-                self.num_dropped += 1
+                stats[DROPPED] += 1
                 all_delivered = False
 
         return all_delivered
 
     # mccole: /publish
+
+    # mccole: publishmany
+    async def publish_many(self, messages: list[Message]) -> bool:
+        """Publish a batch of messages.
+
+        Returns True only if every message reached every subscriber.
+        """
+        all_delivered = True
+        for message in messages:
+            if not await self.publish(message):
+                all_delivered = False
+        return all_delivered
+
+    # mccole: /publishmany
@@ -5,7 +5,7 @@ from backpressure_broker import BackpressureBroker
 
 # mccole: init
 class BackpressurePublisher(Process):
-    """Publisher that adapts to backpressure signals."""
+    """Publisher that adapts its batch size to backpressure signals."""
 
     def init(
         self,
@@ -13,55 +13,55 @@ class BackpressurePublisher(Process):
         name: str,
         topic: str,
         base_interval: float,
-        backoff_multiplier: float = 2.0,
+        max_batch: int = 8,
     ):
         self.broker = broker
         self.name = name
         self.topic = topic
         self.base_interval = base_interval
-        self.backoff_multiplier = backoff_multiplier
+        self.max_batch = max_batch
         self.message_counter = 0
-        self.current_interval = base_interval
+        self.batch_size = 1
         self.backpressure_events = 0
 
     # mccole: /init
 
     # mccole: run
     async def run(self):
-        """Generate and publish messages, slowing down on backpressure."""
+        """Publish batches, growing them additively and shrinking on drops."""
         while True:
-            # Create message.
-            self.message_counter += 1
-            message = Message(
-                topic=self.topic,
-                content=f"Message {self.message_counter} from {self.name}",
-                id=self.message_counter,
-                timestamp=self.now,
-            )
+            # Create a batch of messages.
+            batch = []
+            for _ in range(self.batch_size):
+                self.message_counter += 1
+                batch.append(
+                    Message(
+                        topic=self.topic,
+                        content=f"Message {self.message_counter} from {self.name}",
+                        id=self.message_counter,
+                        timestamp=self.now,
+                    )
+                )
 
-            # Publish message and check if it was delivered.
-            all_delivered = await self.broker.publish(message)
+            # Publish the batch and check if everything was delivered.
+            all_delivered = await self.broker.publish_many(batch)
 
             if all_delivered:
                 print(
-                    f"[{self.now:.1f}] {self.name} published: {message.content} "
-                    f"(interval: {self.current_interval:.1f}s)"
+                    f"[{self.now:.1f}] {self.name} published batch of {len(batch)}"
                 )
-                # Success - gradually return to base rate.
-                if self.current_interval > self.base_interval:
-                    self.current_interval = max(
-                        self.base_interval, self.current_interval / 1.5
-                    )
+                # Success - grow the batch additively.
+                self.batch_size = min(self.max_batch, self.batch_size + 1)
             else:
-                # Backpressure detected - slow down.
+                # Backpressure detected - halve the batch.
                 self.backpressure_events += 1
-                self.current_interval *= self.backoff_multiplier
+                self.batch_size = max(1, self.batch_size // 2)
                 print(
                     f"[{self.now:.1f}] {self.name} BACKPRESSURE - "
-                    f"slowing to {self.current_interval:.1f}s interval"
+                    f"shrinking to batch size {self.batch_size}"
                 )
 
-            # Wait before next message.
-            await self.timeout(self.current_interval)
+            # Wait before next batch.
+            await self.timeout(self.base_interval)
 
     # mccole: /run
@@ -8,6 +8,8 @@ from message import Message
 class MessageBroker:
     """A message broker that routes messages to topic subscribers."""
 
+    __slots__ = ("env", "topics", "num_published", "num_delivered")
+
     def __init__(self, env: Environment):
         self.env = env
         self.topics: dict[str, list[Queue]] = defaultdict(list)
@@ -26,12 +28,13 @@ class MessageBroker:
     # mccole: /subscribe
 
     # mccole: publish
-    async def publish(self, message: Message):
+    async def publish(self, message: Message) -> None:
         """Publish a message to all subscribers of its topic."""
         self.num_published += 1
         queues = self.topics.get(message.topic, [])
         for queue in queues:
             await queue.put(message)
-            self.num_delivered += 1
+        # One attribute update after the loop instead of one per subscriber.
+        self.num_delivered += len(queues)
 
     # mccole: /publish
@@ -1,5 +1,6 @@
 from asimpy import Environment, Process, Queue
 from broker import MessageBroker
+from spsc_queue import SPSCQueue
 
 
 # mccole: consumer
@@ -13,15 +14,16 @@ class ConsumerGroup:
         self.queue = broker.subscribe(topic)
         self.consumers = []
 
-        # Create consumer queues for load balancing
+        # Each distributor-to-consumer path has exactly one producer and
+        # one consumer, so a ring buffer avoids general queue overhead.
         for i in range(num_consumers):
-            consumer_queue = Queue(env)
+            consumer_queue = SPSCQueue(env)
             self.consumers.append(consumer_queue)
 
         # Start distributor process
         self._distributor = _Distributor(env, self.queue, self.consumers)
 
-    def get_consumer_queue(self, index: int) -> Queue:
+    def get_consumer_queue(self, index: int) -> SPSCQueue:
         """Get queue for a specific consumer in the group."""
         return self.consumers[index]
 
@@ -33,7 +35,7 @@ class ConsumerGroup:
 class _Distributor(Process):
     """Distribute messages round-robin to consumers."""
 
-    def init(self, source: Queue, destinations: list[Queue]):
+    def init(self, source: Queue, destinations: list[SPSCQueue]):
         self.source = source
         self.destinations = destinations
         self.next_dest = 0
@@ -43,7 +45,7 @@ class _Distributor(Process):
         while True:
             message = await self.source.get()
             dest = self.destinations[self.next_dest]
-            await dest.put(message)
+            dest.push(message)
             self.next_dest = (self.next_dest + 1) % len(self.destinations)
 
 
@@ -33,7 +33,7 @@ def main():
     print(f"Messages delivered: {broker.num_delivered}")
     print(f"Messages dropped: {broker.num_dropped}")
     print(f"Backpressure events: {fast_publisher.backpressure_events}")
-    print(f"Final interval: {fast_publisher.current_interval:.1f}s")
+    print(f"Final batch size: {fast_publisher.batch_size}")
     print(f"Messages received: {slow_subscriber.num_received}")
 # mccole: /sim
 
@@ -2,7 +2,7 @@ from dataclasses import dataclass
 
 
 # mccole: message
-@dataclass
+@dataclass(slots=True)
 class Message:
     topic: str
     content: str
@@ -7,7 +7,7 @@ from message import Message
 
 
 # mccole: message
-@dataclass
+@dataclass(slots=True)
 class PriorityMessage(Message):
     """Message with priority level."""
 
@@ -24,6 +24,8 @@ class PriorityMessage(Message):
 class PriorityBackpressureBroker:
     """Broker that uses priority queues with bounded capacity."""
 
+    __slots__ = ("env", "max_queue_size", "topics", "num_published", "num_delivered")
+
     def __init__(self, env: Environment, max_queue_size: int = 10):
         self.env = env
         self.max_queue_size = max_queue_size
@@ -47,20 +49,23 @@ class PriorityBackpressureBroker:
         self.num_published += 1
         queues = self.topics.get(message.topic, [])
 
+        # Count deliveries in a local and update the attribute once.
+        delivered = 0
         all_delivered = True
         for queue in queues:
             if not queue.is_full():
                 await queue.put(message)
-                self.num_delivered += 1
+                delivered += 1
             else:
                 # Displace lowest priority item if new message has higher priority
                 bisect.insort(queue._items, message)
                 kept = message is not queue._items[-1]
                 queue._items = queue._items[: queue._capacity]
                 if kept:
-                    self.num_delivered += 1
+                    delivered += 1
                 else:
                     all_delivered = False
+        self.num_delivered += delivered
 
         return all_delivered
 
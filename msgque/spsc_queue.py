@@ -0,0 +1,61 @@
+from typing import Any
+from asimpy import Environment, Event, QueueFull
+
+
+# mccole: spsc
+class SPSCQueue:
+    """Single-producer single-consumer ring buffer.
+
+    The producer pushes without awaiting; the consumer only suspends
+    when the buffer is empty. Capacity is rounded up to a power of two
+    so wrapping an index is a bit-mask instead of a modulo.
+    """
+
+    __slots__ = ("_env", "_buf", "_mask", "_head", "_tail", "_getter")
+
+    def __init__(self, env: Environment, capacity: int = 64):
+        cap = 1
+        while cap < capacity:
+            cap *= 2
+        self._env = env
+        self._buf: list = [None] * cap
+        self._mask = cap - 1
+        self._head = 0
+        self._tail = 0
+        self._getter: Event | None = None
+
+    def is_empty(self) -> bool:
+        """True if the buffer has no items."""
+        return self._head == self._tail
+
+    def size(self) -> int:
+        """Number of items currently buffered."""
+        return self._tail - self._head
+
+    def push(self, item: Any) -> None:
+        """Add an item without awaiting, waking the consumer if it is waiting."""
+        getter = self._getter
+        if getter is not None:
+            self._getter = None
+            getter.succeed(item)
+            return
+        if self._tail - self._head > self._mask:
+            raise QueueFull("ring buffer is at capacity")
+        self._buf[self._tail & self._mask] = item
+        self._tail += 1
+
+    def get(self) -> Event:
+        """Return an Event whose value is the next item."""
+        evt = Event(self._env)
+        if self._head != self._tail:
+            slot = self._head & self._mask
+            item = self._buf[slot]
+            self._buf[slot] = None
+            self._head += 1
+            evt.succeed(item)
+        else:
+            self._getter = evt
+        return evt
+
+
+# mccole: /spsc
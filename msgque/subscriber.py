@@ -1,4 +1,5 @@
-from asimpy import FirstOf, Process
+from collections import deque
+from asimpy import Event, Process
 from broker import MessageBroker
 
 
@@ -24,13 +25,47 @@ class Subscriber(Process):
             queue = broker.subscribe(topic)
             self.queues[topic] = queue
 
+        # Most subscribers watch one topic; remember it so run() can
+        # skip the multi-topic machinery in that case.
+        if len(self.queues) == 1:
+            self._only_topic, self._only_queue = next(iter(self.queues.items()))
+        else:
+            self._only_topic = self._only_queue = None
+
+        # One in-flight get() per topic, kept across iterations so the
+        # multi-topic path never rebuilds a dict of fresh events.
+        self._ready: deque = deque()
+        self._wakeup: Event | None = None
+
+    def _arm(self, topic: str) -> None:
+        """Start (or restart) the in-flight get() for one topic."""
+        evt = self.queues[topic].get()
+        evt._add_waiter(lambda value, t=topic: self._deliver(t, value))
+
+    def _deliver(self, topic: str, message) -> None:
+        """Record an arrived message and wake run() if it is waiting."""
+        self._ready.append((topic, message))
+        if self._wakeup is not None:
+            self._wakeup.succeed()
+            self._wakeup = None
+
     async def run(self):
+        if self._only_queue is None:
+            for topic in self.queues:
+                self._arm(topic)
+
         while True:
             # Wait for a message from any queue.
-            get_operations = {
-                topic: queue.get() for topic, queue in self.queues.items()
-            }
-            topic, message = await FirstOf(self._env, **get_operations)
+            if self._only_queue is not None:
+                topic = self._only_topic
+                message = await self._only_queue.get()
+            else:
+                while not self._ready:
+                    self._wakeup = Event(self._env)
+                    await self._wakeup
+                topic, message = self._ready.popleft()
+                # Only the topic that produced a message needs re-arming.
+                self._arm(topic)
 
             # Report.
             self.num_received += 1
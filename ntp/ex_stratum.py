@@ -1,10 +1,30 @@
-from asimpy import Environment, Queue, Process
+import logging
+import sys
+
+from asimpy import Environment, Event, Queue, Process
 from ntp_server import NTPServer
 from ntp_client import NTPClient
 from ntp_message import NTPMessage
 from dsdx import dsdx
 
 
+# mccole: clockstate
+class ClockState:
+    """Clock offset shared between a server's client and server processes.
+
+    A slotted attribute is cheaper to read than a dict entry, and
+    get_local_time() runs on every timestamp.
+    """
+
+    __slots__ = ("offset",)
+
+    def __init__(self):
+        self.offset = 0.0
+
+
+# mccole: /clockstate
+
+
 # mccole: stratumserver
 class StratumServerProcess(Process):
     """Server process for a stratum N+1 NTP server."""
@@ -14,7 +34,7 @@ class StratumServerProcess(Process):
         name: str,
         local_queue: Queue,
         stratum: int,
-        clock_state: dict,
+        clock_state: "ClockState",
         network_delay: float = 0.1,
     ):
         self.name = name
@@ -25,22 +45,28 @@ class StratumServerProcess(Process):
 
     def get_local_time(self) -> float:
         """Get current time according to local clock."""
-        return self.now + self.clock_state["offset"]
+        return self.now + self.clock_state.offset
 
     async def run(self):
         """Serve requests from downstream clients."""
+        # Hoist per-iteration attribute lookups out of the hot loop.
+        get = self.local_queue.get
+        timeout = self.timeout
+        clock = self.clock_state
         while True:
-            client_queue, message = await self.local_queue.get()
+            reply, message = await get()
 
             # Record timestamps
-            message.t2 = self.get_local_time()
-            await self.timeout(0.001)
-            message.t3 = self.get_local_time()
+            message.t2 = self.now + clock.offset
+            await timeout(0.001)
+            message.t3 = self.now + clock.offset
             message.stratum = self.stratum
 
             # Send response
-            await self.timeout(self.network_delay)
-            await client_queue.put(message)
+            await timeout(self.network_delay)
+            reply.succeed(message)
+
+
 # mccole: /stratumserver
 
 
@@ -53,7 +79,7 @@ class StratumClientProcess(Process):
         name: str,
         upstream_queue: Queue,
         stratum: int,
-        clock_state: dict,
+        clock_state: "ClockState",
         sync_interval: float,
         network_delay: float = 0.1,
     ):
@@ -63,40 +89,47 @@ class StratumClientProcess(Process):
         self.clock_state = clock_state  # Shared with server process
         self.sync_interval = sync_interval
         self.network_delay = network_delay
-        self.response_queue = Queue(self._env)
 
     def get_local_time(self) -> float:
         """Get current time according to local clock."""
-        return self.now + self.clock_state["offset"]
+        return self.now + self.clock_state.offset
 
     async def run(self):
         """Sync with upstream server."""
+        # Hoist per-iteration attribute lookups out of the hot loop.
+        timeout = self.timeout
+        put = self.upstream_queue.put
+        clock = self.clock_state
         while True:
-            await self.timeout(self.sync_interval)
+            await timeout(self.sync_interval)
 
-            # Send request to upstream
-            message = NTPMessage(t1=self.get_local_time())
-            await self.timeout(self.network_delay)
-            await self.upstream_queue.put((self.response_queue, message))
+            # Send request to upstream with a one-shot reply event
+            message = NTPMessage(t1=self.now + clock.offset)
+            reply = Event(self._env)
+            await timeout(self.network_delay)
+            await put((reply, message))
 
             # Wait for response
-            response = await self.response_queue.get()
-            response.t4 = self.get_local_time()
+            response = await reply
+            response.t4 = self.now + clock.offset
 
             # Adjust clock (updates shared state)
             offset = response.calculate_offset()
-            self.clock_state["offset"] -= offset
+            clock.offset -= offset
 
             print(
                 f"[{self.now:.3f}] {self.name} (stratum {self.stratum}): "
                 f"Synced with upstream, offset={offset:.3f}"
             )
+
+
 # mccole: /stratumclient
 
 
 # mccole: hierarchy
 def main():
     """Demonstrate NTP stratum hierarchy."""
+    logging.basicConfig(level=logging.INFO, format="%(message)s", stream=sys.stdout)
     env = Environment()
 
     # Stratum 1: Primary time server
@@ -106,7 +139,7 @@ def main():
     # Stratum 2: Secondary servers syncing with stratum 1
     # Each stratum 2 server has both client and server processes
     s2a_queue = Queue(env)
-    s2a_clock = {"offset": 0.0}  # Shared clock state
+    s2a_clock = ClockState()  # Shared clock state
     StratumClientProcess(
         env,
         "stratum2a.org",
@@ -120,7 +153,7 @@ def main():
     )
 
     s2b_queue = Queue(env)
-    s2b_clock = {"offset": 0.0}  # Shared clock state
+    s2b_clock = ClockState()  # Shared clock state
     StratumClientProcess(
         env,
         "stratum2b.org",
@@ -147,10 +180,12 @@ def main():
 
     print("\n=== Stratum Hierarchy Results ===")
     print(f"Stratum 1 server requests: {stratum1.requests_served}")
-    print(f"\nStratum 2a clock offset: {s2a_clock['offset']:.6f}s")
-    print(f"Stratum 2b clock offset: {s2b_clock['offset']:.6f}s")
+    print(f"\nStratum 2a clock offset: {s2a_clock.offset:.6f}s")
+    print(f"Stratum 2b clock offset: {s2b_clock.offset:.6f}s")
     print(f"\nClient A final offset: {client_a.clock_offset:.6f}s")
     print(f"Client B final offset: {client_b.clock_offset:.6f}s")
+
+
 # mccole: /hierarchy
 
 
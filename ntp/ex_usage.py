@@ -1,3 +1,6 @@
+import logging
+import sys
+
 from asimpy import Environment, Queue
 from ntp_server import NTPServer
 from ntp_client import NTPClient
@@ -7,6 +10,7 @@ from dsdx import dsdx
 # mccole: simulate
 def main():
     """Simulate NTP clock synchronization."""
+    logging.basicConfig(level=logging.INFO, format="%(message)s", stream=sys.stdout)
     env = Environment()
 
     # Create server queue
@@ -55,6 +59,8 @@ def main():
             print(
                 f"  Average correction: {sum(client.offset_history) / len(client.offset_history):.6f}s"
             )
+
+
 # mccole: /simulate
 
 
@@ -2,7 +2,7 @@ from dataclasses import dataclass
 
 
 # mccole: ntpmessage
-@dataclass
+@dataclass(slots=True)
 class NTPMessage:
     """A simplified NTP message packet."""
 
@@ -1,5 +1,9 @@
+import logging
+
 from asimpy import Process, Queue
 
+logger = logging.getLogger(__name__)
+
 
 # mccole: ntpserver
 class NTPServer(Process):
@@ -22,7 +26,7 @@ class NTPServer(Process):
         """Process incoming NTP requests."""
         while True:
             # Wait for a request
-            client_queue, message = await self.request_queue.get()
+            reply, message = await self.request_queue.get()
 
             # Record server receive time (t2)
             message.t2 = self.now
@@ -34,14 +38,20 @@ class NTPServer(Process):
             message.t3 = self.now
             message.stratum = self.stratum
 
-            print(
-                f"[{self.now:.3f}] {self.name} (stratum {self.stratum}): "
-                f"Responding to request (t2={message.t2:.3f}, t3={message.t3:.3f})"
+            logger.info(
+                "[%.3f] %s (stratum %s): Responding to request (t2=%.3f, t3=%.3f)",
+                self.now,
+                self.name,
+                self.stratum,
+                message.t2,
+                message.t3,
             )
 
             # Send response back to client with network delay
             await self.timeout(self.network_delay)
-            await client_queue.put(message)
+            reply.succeed(message)
 
             self.requests_served += 1
+
+
 # mccole: /ntpserver
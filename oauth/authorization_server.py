@@ -1,6 +1,8 @@
 """OAuth 2.0 Authorization Server implementation."""
 
-from asimpy import Process, Queue, FirstOf
+import heapq
+import logging
+from asimpy import Process, Queue
 from typing import Dict, List
 from oauth_types import (
     AuthorizationRequest,
@@ -9,17 +11,21 @@ from oauth_types import (
     TokenResponse,
     AuthorizationCode,
     AccessToken,
+    ERROR_TOKEN_RESPONSE,
     generate_token,
 )
 
+logger = logging.getLogger(__name__)
+
 
 # mccole: init
 class AuthorizationServer(Process):
     """OAuth 2.0 authorization server."""
 
     def init(self):
-        self.auth_queue = Queue(self._env)
-        self.token_queue = Queue(self._env)
+        # One tagged queue for both kinds of request, so the main loop
+        # needs a single get() instead of racing two queues.
+        self.request_queue = Queue(self._env)
 
         # Registered clients
         self.clients: Dict[str, Dict] = {}
@@ -30,13 +36,25 @@ class AuthorizationServer(Process):
         # Issued access tokens
         self.access_tokens: Dict[str, AccessToken] = {}
 
+        # Expiry heaps so stale codes and tokens can be evicted in
+        # time order instead of scanning the dicts.
+        self._code_expiry: list[tuple[float, str]] = []
+        self._token_expiry: list[tuple[float, str]] = []
+
         # User credentials (simplified - real systems use secure storage)
         self.users = {
             "alice@example.com": "password123",
             "bob@example.com": "secret456",
         }
 
-        print(f"[{self.now:.1f}] Authorization Server started")
+        # Static dispatch table for the two request kinds.
+        self._handlers = {
+            "auth": self.handle_authorization_request,
+            "token": self.handle_token_request,
+        }
+
+        logger.info("[%.1f] Authorization Server started", self.now)
+
     # mccole: /init
 
     # mccole: register
@@ -48,55 +66,82 @@ class AuthorizationServer(Process):
             "secret": client_secret,
             "redirect_uris": redirect_uris,
         }
-        print(f"[{self.now:.1f}] Registered client: {client_id}")
+        logger.info("[%.1f] Registered client: %s", self.now, client_id)
+
     # mccole: /register
 
+    # mccole: submit
+    def submit_auth(self, request: AuthorizationRequest):
+        """Queue an authorization request for processing."""
+        return self.request_queue.put(("auth", request))
+
+    def submit_token(self, request: TokenRequest):
+        """Queue a token request for processing."""
+        return self.request_queue.put(("token", request))
+
+    # mccole: /submit
+
+    # mccole: evict
+    def evict_expired(self):
+        """Drop authorization codes and access tokens that have expired."""
+        while self._code_expiry and self._code_expiry[0][0] < self.now:
+            _, code = heapq.heappop(self._code_expiry)
+            self.auth_codes.pop(code, None)
+        while self._token_expiry and self._token_expiry[0][0] < self.now:
+            _, token = heapq.heappop(self._token_expiry)
+            self.access_tokens.pop(token, None)
+    # mccole: /evict
+
     # mccole: run
     async def run(self):
         """Main server loop."""
+        get = self.request_queue.get
+        handlers = self._handlers
         while True:
             # Handle both authorization and token requests
-            name, request = await FirstOf(
-                self._env, auth=self.auth_queue.get(), token=self.token_queue.get()
-            )
+            kind, request = await get()
+            await handlers[kind](request)
 
-            if name == "auth":
-                await self.handle_authorization_request(request)
-            elif name == "token":
-                await self.handle_token_request(request)
     # mccole: /run
 
     # mccole: handle_auth
     async def handle_authorization_request(self, request: AuthorizationRequest):
         """Handle authorization request from client."""
-        print(f"[{self.now:.1f}] AuthServer: Received {request}")
+        self.evict_expired()
+        logger.info("[%.1f] AuthServer: Received %s", self.now, request)
 
         if not self._validate_auth_request(request):
             return
 
         # Simulate user authentication and consent
         await self.timeout(0.5)  # User login time
-        print(f"[{self.now:.1f}] AuthServer: User authenticated, showing consent")
+        logger.info("[%.1f] AuthServer: User authenticated, showing consent", self.now)
 
         await self.timeout(0.3)  # User consent time
-        print(f"[{self.now:.1f}] AuthServer: User granted permissions: {request.scope}")
+        logger.info(
+            "[%.1f] AuthServer: User granted permissions: %s", self.now, request.scope
+        )
 
         await self._issue_authorization_code(request)
+
     # mccole: /handle_auth
 
     # mccole: validate_auth
     def _validate_auth_request(self, request: AuthorizationRequest) -> bool:
         """Check that the client is registered and the redirect URI is allowed."""
         if request.client_id not in self.clients:
-            print(f"[{self.now:.1f}] AuthServer: Unknown client {request.client_id}")
+            logger.info(
+                "[%.1f] AuthServer: Unknown client %s", self.now, request.client_id
+            )
             return False
 
         client = self.clients[request.client_id]
         if request.redirect_uri not in client["redirect_uris"]:
-            print(f"[{self.now:.1f}] AuthServer: Invalid redirect URI")
+            logger.info("[%.1f] AuthServer: Invalid redirect URI", self.now)
             return False
 
         return True
+
     # mccole: /validate_auth
 
     # mccole: issue_code
@@ -111,66 +156,71 @@ class AuthorizationServer(Process):
             expires_at=self.now + 600,  # 10 minute expiry
         )
         self.auth_codes[code] = auth_code
+        heapq.heappush(self._code_expiry, (auth_code.expires_at, code))
 
         response = AuthorizationResponse(code=code, state=request.state)
         await request.response_queue.put(response)
 
-        print(f"[{self.now:.1f}] AuthServer: Issued authorization code")
+        logger.info("[%.1f] AuthServer: Issued authorization code", self.now)
+
     # mccole: /issue_code
 
     # mccole: handle_token
     async def handle_token_request(self, request: TokenRequest):
         """Exchange authorization code for access token."""
-        print(f"[{self.now:.1f}] AuthServer: Received {request}")
+        self.evict_expired()
+        logger.info("[%.1f] AuthServer: Received %s", self.now, request)
 
         auth_code = await self._validate_token_request(request)
         if auth_code is None:
             return
 
         await self._issue_access_token(request, auth_code)
+
     # mccole: /handle_token
 
+    # mccole: fail
+    async def _fail(self, request: TokenRequest, reason: str):
+        """Log a rejection and send the shared error response."""
+        logger.info("[%.1f] AuthServer: %s", self.now, reason)
+        await request.response_queue.put(ERROR_TOKEN_RESPONSE)
+
+    # mccole: /fail
+
     # mccole: validate_token
     async def _validate_token_request(
         self, request: TokenRequest
     ) -> AuthorizationCode | None:
         """Validate client credentials and authorization code; return code or None."""
-        error = TokenResponse(access_token="", token_type="error")
-
         if request.client_id not in self.clients:
-            print(f"[{self.now:.1f}] AuthServer: Unknown client")
-            await request.response_queue.put(error)
+            await self._fail(request, "Unknown client")
             return None
 
         client = self.clients[request.client_id]
         if client["secret"] != request.client_secret:
-            print(f"[{self.now:.1f}] AuthServer: Invalid client secret")
-            await request.response_queue.put(error)
+            await self._fail(request, "Invalid client secret")
             return None
 
         if request.code not in self.auth_codes:
-            print(f"[{self.now:.1f}] AuthServer: Invalid authorization code")
-            await request.response_queue.put(error)
+            await self._fail(request, "Invalid authorization code")
             return None
 
         auth_code = self.auth_codes[request.code]
 
         if not auth_code.is_valid(self.now):
-            print(f"[{self.now:.1f}] AuthServer: Authorization code expired or used")
-            await request.response_queue.put(error)
+            await self._fail(request, "Authorization code expired or used")
             return None
 
         if auth_code.client_id != request.client_id:
-            print(f"[{self.now:.1f}] AuthServer: Code issued to different client")
-            await request.response_queue.put(error)
+            await self._fail(request, "Code issued to different client")
             return None
 
         if auth_code.redirect_uri != request.redirect_uri:
-            print(f"[{self.now:.1f}] AuthServer: Redirect URI mismatch")
-            await request.response_queue.put(error)
+            await self._fail(request, "Redirect URI mismatch")
             return None
 
         return auth_code
+
     # mccole: /validate_token
 
     # mccole: issue_token
@@ -188,6 +238,7 @@ class AuthorizationServer(Process):
             expires_at=self.now + 3600,  # 1 hour expiry
         )
         self.access_tokens[access_token] = token
+        heapq.heappush(self._token_expiry, (token.expires_at, access_token))
 
         response = TokenResponse(
             access_token=access_token,
@@ -197,5 +248,6 @@ class AuthorizationServer(Process):
         )
         await request.response_queue.put(response)
 
-        print(f"[{self.now:.1f}] AuthServer: Issued access token")
+        logger.info("[%.1f] AuthServer: Issued access token", self.now)
+
     # mccole: /issue_token
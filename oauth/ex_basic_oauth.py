@@ -1,5 +1,8 @@
 """Basic OAuth 2.0 authorization code flow demonstration."""
 
+import logging
+import sys
+
 from asimpy import Environment
 from authorization_server import AuthorizationServer
 from resource_server import ResourceServer
@@ -10,6 +13,7 @@ from dsdx import dsdx
 # mccole: sim
 def main():
     """Demonstrate basic OAuth 2.0 authorization code flow."""
+    logging.basicConfig(level=logging.INFO, format="%(message)s", stream=sys.stdout)
     env = Environment()
 
     # Create authorization server
@@ -39,6 +43,8 @@ def main():
 
     # Run simulation
     env.run(until=20)
+
+
 # mccole: /sim
 
 
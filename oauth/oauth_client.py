@@ -1,9 +1,11 @@
 """OAuth 2.0 Client implementation."""
 
+import logging
 from asimpy import Process, Queue
 from typing import Optional, List
 from oauth_types import (
     AuthorizationRequest,
+    BatchResourceRequest,
     TokenRequest,
     ResourceRequest,
     TokenResponse,
@@ -12,6 +14,8 @@ from oauth_types import (
 from authorization_server import AuthorizationServer
 from resource_server import ResourceServer
 
+logger = logging.getLogger(__name__)
+
 
 # mccole: init
 class OAuthClient(Process):
@@ -33,7 +37,12 @@ class OAuthClient(Process):
 
         self.access_token: Optional[str] = None
 
-        print(f"[{self.now:.1f}] Client '{client_id}' started")
+        # The client awaits each response before sending the next request,
+        # so one reusable queue serves every exchange.
+        self._response_queue = Queue(self._env)
+
+        logger.info("[%.1f] Client '%s' started", self.now, client_id)
+
     # mccole: /init
 
     # mccole: run
@@ -44,102 +53,128 @@ class OAuthClient(Process):
         code = await self.request_authorization(scopes)
 
         if not code:
-            print(f"[{self.now:.1f}] Client: Authorization failed")
+            logger.info("[%.1f] Client: Authorization failed", self.now)
             return
 
         # Step 2: Exchange code for token
         token_response = await self.exchange_code_for_token(code)
 
         if not token_response or token_response.token_type == "error":
-            print(f"[{self.now:.1f}] Client: Token exchange failed")
+            logger.info("[%.1f] Client: Token exchange failed", self.now)
             return
 
         self.access_token = token_response.access_token
-        print(f"[{self.now:.1f}] Client: Got access token!")
+        logger.info("[%.1f] Client: Got access token!", self.now)
 
-        # Step 3: Access protected resources
+        # Step 3: Access protected resources in one batched round trip
+        # (the last path is outside the granted scope).
         await self.timeout(0.5)
-        await self.access_resource("/api/profile")
+        await self.access_resources(["/api/profile", "/api/photos", "/api/messages"])
 
-        await self.timeout(0.5)
-        await self.access_resource("/api/photos")
-
-        # Try accessing resource without permission
-        await self.timeout(0.5)
-        await self.access_resource("/api/messages")
     # mccole: /run
 
     # mccole: request_auth
     async def request_authorization(self, scopes: List[str]) -> Optional[str]:
         """Step 1: Request user authorization."""
-        print(f"[{self.now:.1f}] Client: Requesting authorization for {scopes}")
+        logger.info("[%.1f] Client: Requesting authorization for %s", self.now, scopes)
 
         state = generate_token("state")  # CSRF protection
-        response_queue = Queue(self._env)
-
         request = AuthorizationRequest(
             client_id=self.client_id,
             redirect_uri=self.redirect_uri,
             scope=scopes,
             state=state,
-            response_queue=response_queue,
+            response_queue=self._response_queue,
         )
 
-        await self.auth_server.auth_queue.put(request)
-        response = await response_queue.get()
+        await self.auth_server.submit_auth(request)
+        response = await self._response_queue.get()
 
         # Validate state to prevent CSRF
         if response.state != state:
-            print(f"[{self.now:.1f}] Client: State mismatch - possible CSRF attack!")
+            logger.info(
+                "[%.1f] Client: State mismatch - possible CSRF attack!", self.now
+            )
             return None
 
-        print(f"[{self.now:.1f}] Client: Received authorization code")
+        logger.info("[%.1f] Client: Received authorization code", self.now)
         return response.code
+
     # mccole: /request_auth
 
     # mccole: exchange_code
     async def exchange_code_for_token(self, code: str) -> Optional[TokenResponse]:
         """Step 2: Exchange authorization code for access token."""
-        print(f"[{self.now:.1f}] Client: Exchanging code for token")
-
-        response_queue = Queue(self._env)
+        logger.info("[%.1f] Client: Exchanging code for token", self.now)
 
         request = TokenRequest(
             code=code,
             client_id=self.client_id,
             client_secret=self.client_secret,
             redirect_uri=self.redirect_uri,
-            response_queue=response_queue,
+            response_queue=self._response_queue,
         )
 
-        await self.auth_server.token_queue.put(request)
-        response = await response_queue.get()
+        await self.auth_server.submit_token(request)
+        response = await self._response_queue.get()
 
         return response
+
     # mccole: /exchange_code
 
     # mccole: access_resource
     async def access_resource(self, path: str):
         """Step 3: Access protected resource with token."""
-        print(f"[{self.now:.1f}] Client: Accessing {path}")
+        logger.info("[%.1f] Client: Accessing %s", self.now, path)
 
         if not self.access_token:
-            print(f"[{self.now:.1f}] Client: No access token!")
+            logger.info("[%.1f] Client: No access token!", self.now)
             return
 
-        response_queue = Queue(self._env)
-
         request = ResourceRequest(
             access_token=self.access_token,
             resource_path=path,
-            response_queue=response_queue,
+            response_queue=self._response_queue,
         )
 
         await self.resource_server.resource_queue.put(request)
-        response = await response_queue.get()
+        response = await self._response_queue.get()
 
         if response.success:
-            print(f"[{self.now:.1f}] Client: Success! Data: {response.data}")
+            logger.info("[%.1f] Client: Success! Data: %s", self.now, response.data)
         else:
-            print(f"[{self.now:.1f}] Client: Failed - {response.error}")
+            logger.info("[%.1f] Client: Failed - %s", self.now, response.error)
+
     # mccole: /access_resource
+
+    # mccole: access_resources
+    async def access_resources(self, paths: List[str]):
+        """Fetch several protected resources with one round trip."""
+        logger.info("[%.1f] Client: Accessing batch %s", self.now, paths)
+
+        if not self.access_token:
+            logger.info("[%.1f] Client: No access token!", self.now)
+            return
+
+        request = BatchResourceRequest(
+            access_token=self.access_token,
+            paths=paths,
+            response_queue=self._response_queue,
+        )
+
+        await self.resource_server.resource_queue.put(request)
+        responses = await self._response_queue.get()
+
+        for path, response in zip(paths, responses):
+            if response.success:
+                logger.info(
+                    "[%.1f] Client: %s - Success! Data: %s",
+                    self.now,
+                    path,
+                    response.data,
+                )
+            else:
+                logger.info(
+                    "[%.1f] Client: %s - Failed - %s", self.now, path, response.error
+                )
+    # mccole: /access_resources
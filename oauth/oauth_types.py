@@ -1,22 +1,34 @@
 """Data types for OAuth 2.0 implementation."""
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from asimpy import Queue
 from typing import Any
-import random
-import string
+import secrets
+
+
+# Shared frozensets for canonical scope combinations, so identical
+# scope lists dedupe to one object and subset checks stay warm.
+_SCOPE_CACHE: dict[tuple[str, ...], frozenset[str]] = {}
+
+
+def canonical_scopes(scopes) -> frozenset[str]:
+    """Return a shared frozenset for a scope list."""
+    key = tuple(sorted(scopes))
+    cached = _SCOPE_CACHE.get(key)
+    if cached is None:
+        cached = _SCOPE_CACHE[key] = frozenset(key)
+    return cached
 
 
 # mccole: token_func
 def generate_token(prefix: str = "tok") -> str:
     """Generate a random token."""
-    random_part = "".join(random.choices(string.ascii_letters + string.digits, k=16))
-    return f"{prefix}_{random_part}"
+    return f"{prefix}_{secrets.token_urlsafe(12)}"
 # mccole: /token_func
 
 
 # mccole: message_types
-@dataclass
+@dataclass(slots=True)
 class AuthorizationRequest:
     """Request for user authorization."""
 
@@ -30,7 +42,7 @@ class AuthorizationRequest:
         return f"AuthRequest(client={self.client_id}, scope={self.scope})"
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class AuthorizationResponse:
     """Response with authorization code."""
 
@@ -41,7 +53,7 @@ class AuthorizationResponse:
         return f"AuthResponse(code={self.code[:8]}...)"
 
 
-@dataclass
+@dataclass(slots=True)
 class TokenRequest:
     """Request to exchange code for access token."""
 
@@ -55,7 +67,7 @@ class TokenRequest:
         return f"TokenRequest(client={self.client_id})"
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class TokenResponse:
     """Response with access token."""
 
@@ -69,7 +81,12 @@ class TokenResponse:
         return f"TokenResponse(token={self.access_token[:8]}...)"
 
 
-@dataclass
+# Shared response for every token-request failure; the type is frozen,
+# so one instance can serve all error paths without reallocation.
+ERROR_TOKEN_RESPONSE = TokenResponse(access_token="", token_type="error")
+
+
+@dataclass(slots=True)
 class ResourceRequest:
     """Request to access protected resource."""
 
@@ -81,7 +98,19 @@ class ResourceRequest:
         return f"ResourceRequest(path={self.resource_path})"
 
 
-@dataclass
+@dataclass(slots=True)
+class BatchResourceRequest:
+    """Request to access several protected resources in one round trip."""
+
+    access_token: str
+    paths: list[str]
+    response_queue: Queue
+
+    def __str__(self):
+        return f"BatchResourceRequest(paths={self.paths})"
+
+
+@dataclass(frozen=True, slots=True)
 class ResourceResponse:
     """Response from resource server."""
 
@@ -97,7 +126,7 @@ class ResourceResponse:
 
 
 # mccole: internal_types
-@dataclass
+@dataclass(slots=True)
 class AuthorizationCode:
     """Authorization code with metadata."""
 
@@ -113,7 +142,7 @@ class AuthorizationCode:
         return not self.used and now < self.expires_at
 
 
-@dataclass
+@dataclass(slots=True)
 class AccessToken:
     """Access token with metadata."""
 
@@ -121,6 +150,11 @@ class AccessToken:
     client_id: str
     scope: list[str]
     expires_at: float
+    # Scope as a frozenset, built once so permission checks never rehash.
+    scope_set: frozenset = field(init=False)
+
+    def __post_init__(self):
+        self.scope_set = canonical_scopes(self.scope)
 
     def is_valid(self, now: float) -> bool:
         """Check if token is still valid."""
@@ -129,7 +163,7 @@ class AccessToken:
 
 
 # mccole: refresh
-@dataclass
+@dataclass(slots=True)
 class RefreshToken:
     """Refresh token for obtaining new access tokens."""
 
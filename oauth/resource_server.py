@@ -1,9 +1,18 @@
 """OAuth 2.0 Resource Server implementation."""
 
+import logging
 from asimpy import Process, Queue
-from oauth_types import AccessToken, ResourceRequest, ResourceResponse
+from oauth_types import (
+    AccessToken,
+    BatchResourceRequest,
+    ResourceRequest,
+    ResourceResponse,
+    canonical_scopes,
+)
 from authorization_server import AuthorizationServer
 
+logger = logging.getLogger(__name__)
+
 
 # mccole: init
 class ResourceServer(Process):
@@ -13,23 +22,25 @@ class ResourceServer(Process):
         self.auth_server = auth_server
         self.resource_queue = Queue(self._env)
 
-        # Protected resources
+        # Protected resources; required scopes are frozensets built once
+        # so each access check avoids rebuilding them.
         self.resources = {
             "/api/profile": {
-                "scope_required": ["profile"],
+                "scope_required": canonical_scopes(["profile"]),
                 "data": {"name": "Alice", "email": "alice@example.com"},
             },
             "/api/photos": {
-                "scope_required": ["photos"],
+                "scope_required": canonical_scopes(["photos"]),
                 "data": {"photos": ["photo1.jpg", "photo2.jpg", "photo3.jpg"]},
             },
             "/api/messages": {
-                "scope_required": ["messages"],
+                "scope_required": canonical_scopes(["messages"]),
                 "data": {"messages": ["Hello!", "How are you?"]},
             },
         }
 
-        print(f"[{self.now:.1f}] Resource Server started")
+        logger.info("[%.1f] Resource Server started", self.now)
+
     # mccole: /init
 
     # mccole: run
@@ -37,13 +48,18 @@ class ResourceServer(Process):
         """Main server loop."""
         while True:
             request = await self.resource_queue.get()
-            await self.handle_resource_request(request)
+            if isinstance(request, BatchResourceRequest):
+                await self.handle_batch_request(request)
+            else:
+                await self.handle_resource_request(request)
+
     # mccole: /run
 
     # mccole: handle_resource
     async def handle_resource_request(self, request: ResourceRequest):
         """Handle API request with access token."""
-        print(f"[{self.now:.1f}] ResourceServer: Received {request}")
+        self.auth_server.evict_expired()
+        logger.info("[%.1f] ResourceServer: Received %s", self.now, request)
 
         token = await self._validate_token(request)
         if token is None:
@@ -53,19 +69,49 @@ class ResourceServer(Process):
         if resource is None:
             return
 
-        print(f"[{self.now:.1f}] ResourceServer: Returning {request.resource_path}")
+        logger.info(
+            "[%.1f] ResourceServer: Returning %s", self.now, request.resource_path
+        )
         await request.response_queue.put(
             ResourceResponse(success=True, data=resource["data"])
         )
+
     # mccole: /handle_resource
 
+    # mccole: handle_batch
+    async def handle_batch_request(self, request: BatchResourceRequest):
+        """Handle several API paths with a single response."""
+        self.auth_server.evict_expired()
+        logger.info("[%.1f] ResourceServer: Received %s", self.now, request)
+
+        responses = [self._fetch(path, request.access_token) for path in request.paths]
+        await request.response_queue.put(responses)
+
+    def _fetch(self, path: str, access_token: str) -> ResourceResponse:
+        """Produce the response for one path without a queue round trip."""
+        tokens = self.auth_server.access_tokens
+        if access_token not in tokens:
+            return ResourceResponse(success=False, error="invalid_token")
+
+        token = tokens[access_token]
+        if not token.is_valid(self.now):
+            return ResourceResponse(success=False, error="token_expired")
+
+        if path not in self.resources:
+            return ResourceResponse(success=False, error="not_found")
+
+        resource = self.resources[path]
+        if not resource["scope_required"].issubset(token.scope_set):
+            return ResourceResponse(success=False, error="insufficient_scope")
+
+        return ResourceResponse(success=True, data=resource["data"])
+    # mccole: /handle_batch
+
     # mccole: validate_token
-    async def _validate_token(
-        self, request: ResourceRequest
-    ) -> AccessToken | None:
+    async def _validate_token(self, request: ResourceRequest) -> AccessToken | None:
         """Check that the token exists and has not expired; send error if not."""
         if request.access_token not in self.auth_server.access_tokens:
-            print(f"[{self.now:.1f}] ResourceServer: Invalid token")
+            logger.info("[%.1f] ResourceServer: Invalid token", self.now)
             await request.response_queue.put(
                 ResourceResponse(success=False, error="invalid_token")
             )
@@ -74,13 +120,14 @@ class ResourceServer(Process):
         token = self.auth_server.access_tokens[request.access_token]
 
         if not token.is_valid(self.now):
-            print(f"[{self.now:.1f}] ResourceServer: Token expired")
+            logger.info("[%.1f] ResourceServer: Token expired", self.now)
             await request.response_queue.put(
                 ResourceResponse(success=False, error="token_expired")
             )
             return None
 
         return token
+
     # mccole: /validate_token
 
     # mccole: check_access
@@ -89,22 +136,21 @@ class ResourceServer(Process):
     ) -> dict | None:
         """Check that the resource exists and the token's scope covers it."""
         if request.resource_path not in self.resources:
-            print(f"[{self.now:.1f}] ResourceServer: Resource not found")
+            logger.info("[%.1f] ResourceServer: Resource not found", self.now)
             await request.response_queue.put(
                 ResourceResponse(success=False, error="not_found")
             )
             return None
 
         resource = self.resources[request.resource_path]
-        required_scopes = set(resource["scope_required"])
-        token_scopes = set(token.scope)
 
-        if not required_scopes.issubset(token_scopes):
-            print(f"[{self.now:.1f}] ResourceServer: Insufficient scope")
+        if not resource["scope_required"].issubset(token.scope_set):
+            logger.info("[%.1f] ResourceServer: Insufficient scope", self.now)
             await request.response_queue.put(
                 ResourceResponse(success=False, error="insufficient_scope")
             )
             return None
 
         return resource
+
     # mccole: /check_access
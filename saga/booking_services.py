@@ -1,9 +1,18 @@
 """Microservices for travel booking saga."""
 
+import logging
+from array import array
 from asimpy import Process, Queue
 from typing import Dict, Any
 import random
 
+logger = logging.getLogger(__name__)
+
+# Each service pre-draws this many uniforms at startup and cycles through
+# them, so a booking attempt costs an array load instead of an RNG call.
+# A power of two lets the index wrap with a mask instead of a modulo.
+_RNG_POOL_SIZE = 65536
+
 
 # mccole: flight_service
 class FlightService(Process):
@@ -13,25 +22,35 @@ class FlightService(Process):
         self.bookings: Dict[str, Dict[str, Any]] = {}
         self.request_queue: Queue = Queue(self._env)
         self.available_seats = 10
+        self.failure_rate = 0.1
+        self._rng_pool = array("d", (random.random() for _ in range(_RNG_POOL_SIZE)))
+        self._rng_idx = 0
 
-        print(f"[{self.now:.1f}] FlightService started (seats: {self.available_seats})")
+        logger.info(
+            "[%.1f] FlightService started (seats: %d)", self.now, self.available_seats
+        )
 
     async def run(self) -> None:
-        """Handle flight booking requests."""
-        while True:
-            await self.timeout(1.0)
+        """Nothing to do: bookings arrive as direct method calls."""
+        return
+
+    def _rand(self) -> float:
+        """Return the next pre-drawn uniform from the pool."""
+        value = self._rng_pool[self._rng_idx]
+        self._rng_idx = (self._rng_idx + 1) & (_RNG_POOL_SIZE - 1)
+        return value
 
     def book_flight(self, booking_id: str, flight_id: str) -> bool:
         """Book a flight (forward transaction)."""
-        print(f"[{self.now:.1f}] FlightService: Booking flight {flight_id}")
+        logger.info("[%.1f] FlightService: Booking flight %s", self.now, flight_id)
 
         # Simulate occasional failures
-        if random.random() < 0.1:
-            print(f"[{self.now:.1f}] FlightService: Booking FAILED - system error")
+        if self._rand() < self.failure_rate:
+            logger.info("[%.1f] FlightService: Booking FAILED - system error", self.now)
             return False
 
         if self.available_seats <= 0:
-            print(f"[{self.now:.1f}] FlightService: Booking FAILED - no seats")
+            logger.info("[%.1f] FlightService: Booking FAILED - no seats", self.now)
             return False
 
         self.available_seats -= 1
@@ -41,27 +60,67 @@ class FlightService(Process):
             "seats": 1,
         }
 
-        print(
-            f"[{self.now:.1f}] FlightService: ✓ Flight booked "
-            f"(remaining: {self.available_seats})"
+        logger.info(
+            "[%.1f] FlightService: ✓ Flight booked (remaining: %d)",
+            self.now,
+            self.available_seats,
         )
         return True
 
+    def book_many(self, requests: list) -> list:
+        """Book a batch of flights, amortizing per-booking overhead.
+
+        Takes (booking_id, flight_id) pairs; returns one bool per pair.
+        Bookings are staged locally and committed with a single dict
+        update and one seat-count adjustment.
+        """
+        results = []
+        accepted = 0
+        available = self.available_seats
+        staged = {}
+        rate = self.failure_rate
+        fails = [self._rand() < rate for _ in requests]
+        for i, (booking_id, flight_id) in enumerate(requests):
+            if fails[i] or accepted >= available:
+                results.append(False)
+                continue
+            staged[booking_id] = {
+                "flight_id": flight_id,
+                "status": "booked",
+                "seats": 1,
+            }
+            accepted += 1
+            results.append(True)
+
+        self.bookings.update(staged)
+        self.available_seats = available - accepted
+        logger.info(
+            "[%.1f] FlightService: ✓ Booked %d/%d flights (remaining: %d)",
+            self.now,
+            accepted,
+            len(requests),
+            self.available_seats,
+        )
+        return results
+
     def cancel_flight(self, booking_id: str) -> bool:
         """Cancel flight booking (compensation)."""
-        print(f"[{self.now:.1f}] FlightService: COMPENSATING - canceling {booking_id}")
+        logger.info(
+            "[%.1f] FlightService: COMPENSATING - canceling %s", self.now, booking_id
+        )
 
         if booking_id not in self.bookings:
-            print(f"[{self.now:.1f}] FlightService: No booking to cancel")
+            logger.info("[%.1f] FlightService: No booking to cancel", self.now)
             return True
 
         seats = self.bookings[booking_id].get("seats", 1)
         self.available_seats += seats
         self.bookings[booking_id]["status"] = "canceled"
 
-        print(
-            f"[{self.now:.1f}] FlightService: ✓ Flight canceled "
-            f"(available: {self.available_seats})"
+        logger.info(
+            "[%.1f] FlightService: ✓ Flight canceled (available: %d)",
+            self.now,
+            self.available_seats,
         )
         return True
 # mccole: /flight_service
@@ -75,25 +134,35 @@ class HotelService(Process):
         self.bookings: Dict[str, Dict[str, Any]] = {}
         self.request_queue: Queue = Queue(self._env)
         self.available_rooms = 5
+        self.failure_rate = 0.15
+        self._rng_pool = array("d", (random.random() for _ in range(_RNG_POOL_SIZE)))
+        self._rng_idx = 0
 
-        print(f"[{self.now:.1f}] HotelService started (rooms: {self.available_rooms})")
+        logger.info(
+            "[%.1f] HotelService started (rooms: %d)", self.now, self.available_rooms
+        )
 
     async def run(self) -> None:
-        """Handle hotel booking requests."""
-        while True:
-            await self.timeout(1.0)
+        """Nothing to do: bookings arrive as direct method calls."""
+        return
+
+    def _rand(self) -> float:
+        """Return the next pre-drawn uniform from the pool."""
+        value = self._rng_pool[self._rng_idx]
+        self._rng_idx = (self._rng_idx + 1) & (_RNG_POOL_SIZE - 1)
+        return value
 
     def book_hotel(self, booking_id: str, hotel_id: str) -> bool:
         """Book a hotel (forward transaction)."""
-        print(f"[{self.now:.1f}] HotelService: Booking hotel {hotel_id}")
+        logger.info("[%.1f] HotelService: Booking hotel %s", self.now, hotel_id)
 
         # Simulate occasional failures
-        if random.random() < 0.15:
-            print(f"[{self.now:.1f}] HotelService: Booking FAILED - no rooms")
+        if self._rand() < self.failure_rate:
+            logger.info("[%.1f] HotelService: Booking FAILED - no rooms", self.now)
             return False
 
         if self.available_rooms <= 0:
-            print(f"[{self.now:.1f}] HotelService: Booking FAILED - no rooms")
+            logger.info("[%.1f] HotelService: Booking FAILED - no rooms", self.now)
             return False
 
         self.available_rooms -= 1
@@ -103,27 +172,67 @@ class HotelService(Process):
             "rooms": 1,
         }
 
-        print(
-            f"[{self.now:.1f}] HotelService: ✓ Hotel booked "
-            f"(remaining: {self.available_rooms})"
+        logger.info(
+            "[%.1f] HotelService: ✓ Hotel booked (remaining: %d)",
+            self.now,
+            self.available_rooms,
         )
         return True
 
+    def book_many(self, requests: list) -> list:
+        """Book a batch of hotels, amortizing per-booking overhead.
+
+        Takes (booking_id, hotel_id) pairs; returns one bool per pair.
+        Bookings are staged locally and committed with a single dict
+        update and one room-count adjustment.
+        """
+        results = []
+        accepted = 0
+        available = self.available_rooms
+        staged = {}
+        rate = self.failure_rate
+        fails = [self._rand() < rate for _ in requests]
+        for i, (booking_id, hotel_id) in enumerate(requests):
+            if fails[i] or accepted >= available:
+                results.append(False)
+                continue
+            staged[booking_id] = {
+                "hotel_id": hotel_id,
+                "status": "booked",
+                "rooms": 1,
+            }
+            accepted += 1
+            results.append(True)
+
+        self.bookings.update(staged)
+        self.available_rooms = available - accepted
+        logger.info(
+            "[%.1f] HotelService: ✓ Booked %d/%d hotels (remaining: %d)",
+            self.now,
+            accepted,
+            len(requests),
+            self.available_rooms,
+        )
+        return results
+
     def cancel_hotel(self, booking_id: str) -> bool:
         """Cancel hotel booking (compensation)."""
-        print(f"[{self.now:.1f}] HotelService: COMPENSATING - canceling {booking_id}")
+        logger.info(
+            "[%.1f] HotelService: COMPENSATING - canceling %s", self.now, booking_id
+        )
 
         if booking_id not in self.bookings:
-            print(f"[{self.now:.1f}] HotelService: No booking to cancel")
+            logger.info("[%.1f] HotelService: No booking to cancel", self.now)
             return True
 
         rooms = self.bookings[booking_id].get("rooms", 1)
         self.available_rooms += rooms
         self.bookings[booking_id]["status"] = "canceled"
 
-        print(
-            f"[{self.now:.1f}] HotelService: ✓ Hotel canceled "
-            f"(available: {self.available_rooms})"
+        logger.info(
+            "[%.1f] HotelService: ✓ Hotel canceled (available: %d)",
+            self.now,
+            self.available_rooms,
         )
         return True
 # mccole: /hotel_service
@@ -137,55 +246,97 @@ class CarRentalService(Process):
         self.bookings: Dict[str, Dict[str, Any]] = {}
         self.request_queue: Queue = Queue(self._env)
         self.available_cars = 3
+        self.failure_rate = 0.3
+        self._rng_pool = array("d", (random.random() for _ in range(_RNG_POOL_SIZE)))
+        self._rng_idx = 0
 
-        print(
-            f"[{self.now:.1f}] CarRentalService started (cars: {self.available_cars})"
+        logger.info(
+            "[%.1f] CarRentalService started (cars: %d)", self.now, self.available_cars
         )
 
     async def run(self) -> None:
-        """Handle car rental requests."""
-        while True:
-            await self.timeout(1.0)
+        """Nothing to do: bookings arrive as direct method calls."""
+        return
+
+    def _rand(self) -> float:
+        """Return the next pre-drawn uniform from the pool."""
+        value = self._rng_pool[self._rng_idx]
+        self._rng_idx = (self._rng_idx + 1) & (_RNG_POOL_SIZE - 1)
+        return value
 
     def book_car(self, booking_id: str, car_id: str) -> bool:
         """Book a car (forward transaction)."""
-        print(f"[{self.now:.1f}] CarRentalService: Booking car {car_id}")
+        logger.info("[%.1f] CarRentalService: Booking car %s", self.now, car_id)
 
         # Simulate higher failure rate for demonstration
-        if random.random() < 0.3:
-            print(f"[{self.now:.1f}] CarRentalService: Booking FAILED - no cars")
+        if self._rand() < self.failure_rate:
+            logger.info("[%.1f] CarRentalService: Booking FAILED - no cars", self.now)
             return False
 
         if self.available_cars <= 0:
-            print(f"[{self.now:.1f}] CarRentalService: Booking FAILED - no cars")
+            logger.info("[%.1f] CarRentalService: Booking FAILED - no cars", self.now)
             return False
 
         self.available_cars -= 1
         self.bookings[booking_id] = {"car_id": car_id, "status": "booked", "cars": 1}
 
-        print(
-            f"[{self.now:.1f}] CarRentalService: ✓ Car booked "
-            f"(remaining: {self.available_cars})"
+        logger.info(
+            "[%.1f] CarRentalService: ✓ Car booked (remaining: %d)",
+            self.now,
+            self.available_cars,
         )
         return True
 
+    def book_many(self, requests: list) -> list:
+        """Book a batch of cars, amortizing per-booking overhead.
+
+        Takes (booking_id, car_id) pairs; returns one bool per pair.
+        Bookings are staged locally and committed with a single dict
+        update and one car-count adjustment.
+        """
+        results = []
+        accepted = 0
+        available = self.available_cars
+        staged = {}
+        rate = self.failure_rate
+        fails = [self._rand() < rate for _ in requests]
+        for i, (booking_id, car_id) in enumerate(requests):
+            if fails[i] or accepted >= available:
+                results.append(False)
+                continue
+            staged[booking_id] = {"car_id": car_id, "status": "booked", "cars": 1}
+            accepted += 1
+            results.append(True)
+
+        self.bookings.update(staged)
+        self.available_cars = available - accepted
+        logger.info(
+            "[%.1f] CarRentalService: ✓ Booked %d/%d cars (remaining: %d)",
+            self.now,
+            accepted,
+            len(requests),
+            self.available_cars,
+        )
+        return results
+
     def cancel_car(self, booking_id: str) -> bool:
         """Cancel car rental (compensation)."""
-        print(
-            f"[{self.now:.1f}] CarRentalService: COMPENSATING - canceling {booking_id}"
+        logger.info(
+            "[%.1f] CarRentalService: COMPENSATING - canceling %s", self.now, booking_id
         )
 
         if booking_id not in self.bookings:
-            print(f"[{self.now:.1f}] CarRentalService: No booking to cancel")
+            logger.info("[%.1f] CarRentalService: No booking to cancel", self.now)
             return True
 
         cars = self.bookings[booking_id].get("cars", 1)
         self.available_cars += cars
         self.bookings[booking_id]["status"] = "canceled"
 
-        print(
-            f"[{self.now:.1f}] CarRentalService: ✓ Car canceled "
-            f"(available: {self.available_cars})"
+        logger.info(
+            "[%.1f] CarRentalService: ✓ Car canceled (available: %d)",
+            self.now,
+            self.available_cars,
         )
         return True
 # mccole: /car_service
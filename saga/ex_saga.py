@@ -1,5 +1,8 @@
 """Demonstration of orchestration-based Saga pattern."""
 
+import logging
+import sys
+
 from asimpy import Environment, Process
 from saga_orchestrator import SagaOrchestrator
 from booking_services import FlightService, HotelService, CarRentalService
@@ -9,6 +12,7 @@ from dsdx import dsdx
 
 # mccole: orchestratedexample
 def main():
+    logging.basicConfig(level=logging.INFO, format="%(message)s", stream=sys.stdout)
     env = Environment()
 
     # Create services
@@ -1,7 +1,8 @@
 """Data types for Saga pattern implementation."""
 
+from collections import deque
 from dataclasses import dataclass, field
-from typing import List, Dict, Optional, Any, Callable
+from typing import Deque, List, Dict, Optional, Any, Callable
 from enum import Enum
 
 
@@ -27,9 +28,14 @@ class TransactionStatus(Enum):
 
 
 # mccole: sagatypes
-@dataclass
+@dataclass(slots=True)
 class SagaStep:
-    """A step in the saga with transaction and compensation."""
+    """A step in the saga with transaction and compensation.
+
+    Both actions are functools.partial wrappers around the services'
+    bound methods: C-implemented, no closure cells, and called with no
+    arguments at dispatch time.
+    """
 
     name: str
     service_name: str
@@ -40,7 +46,7 @@ class SagaStep:
         return f"Step({self.name})"
 
 
-@dataclass
+@dataclass(slots=True)
 class SagaExecution:
     """Tracks execution of a saga instance."""
 
@@ -48,7 +54,9 @@ class SagaExecution:
     steps: List[SagaStep]
     status: SagaStatus = SagaStatus.PENDING
     current_step: int = 0
-    completed_steps: List[str] = field(default_factory=list)
+    # Completed steps keep the SagaStep itself; compensation pops from
+    # the right end, so the deque always records what is still undone.
+    completed_steps: Deque[SagaStep] = field(default_factory=deque)
     failed_step: Optional[str] = None
     context: Dict[str, Any] = field(default_factory=dict)
 
@@ -56,7 +64,7 @@ class SagaExecution:
         return f"Saga({self.saga_id}, {self.status.value}, step {self.current_step}/{len(self.steps)})"
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class BookingRequest:
     """Travel booking request."""
 
@@ -70,7 +78,7 @@ class BookingRequest:
         return f"Booking({self.booking_id})"
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class SagaEvent:
     """Event in choreographed saga."""
 
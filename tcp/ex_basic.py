@@ -1,5 +1,8 @@
 """Basic TCP communication demonstration."""
 
+import logging
+import sys
+
 from asimpy import Environment
 from unreliable_network import UnreliableNetwork
 from tcp_connection import TCPConnection
@@ -9,6 +12,7 @@ from dsdx import dsdx
 
 # mccole: basicexample
 def main():
+    logging.basicConfig(level=logging.INFO, format="%(message)s", stream=sys.stdout)
     env = Environment()
 
     print("## Basic TCP Demonstration")
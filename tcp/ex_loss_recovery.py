@@ -1,5 +1,8 @@
 """TCP demonstration under extreme packet loss conditions."""
 
+import logging
+import sys
+
 from asimpy import Environment
 from unreliable_network import UnreliableNetwork
 from tcp_connection import TCPConnection
@@ -9,6 +12,10 @@ from dsdx import dsdx
 
 # mccole: highlossexample
 def main():
+    logging.basicConfig(level=logging.INFO, format="%(message)s", stream=sys.stdout)
+    # The high-loss run logs a line per chunk; turning off line buffering
+    # batches those writes into one syscall per buffer flush.
+    sys.stdout.reconfigure(line_buffering=False, write_through=False)
     env = Environment()
 
     print("## High Loss TCP Scenario")
@@ -70,6 +77,10 @@ def main():
         print(f"Success: All {expected_bytes} bytes delivered correctly!")
     else:
         print(f"Incomplete: {server_conn.bytes_received}/{expected_bytes} bytes")
+
+    # Flush everything batched up while line buffering was off
+    logging.shutdown()
+    sys.stdout.flush()
 # mccole: /highlossexample
 
 
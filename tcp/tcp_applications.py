@@ -1,8 +1,11 @@
 """TCP client and server applications."""
 
+import logging
 from asimpy import Process, FirstOf, Timeout
 from tcp_connection import TCPConnection
 
+logger = logging.getLogger(__name__)
+
 
 class TCPClient(Process):
     """Client application using TCP."""
@@ -18,6 +21,9 @@ class TCPClient(Process):
         self.remote_addr = remote_addr
         self.remote_port = remote_port
         self.message = message
+        # Encode once at construction so the coroutine's critical path
+        # does no CPU-bound string work
+        self.data = message.encode("utf-8")
 
     async def run(self) -> None:
         """Connect and send message."""
@@ -25,21 +31,24 @@ class TCPClient(Process):
         success = await self.connection.connect(self.remote_addr, self.remote_port)
 
         if not success:
-            print(f"[{self.now:.1f}] Client: Connection failed")
+            logger.info("[%.1f] Client: Connection failed", self.now)
             return
 
         # Send message
-        data = self.message.encode("utf-8")
-        print(f"\n[{self.now:.1f}] Client: Sending message ({len(data)} bytes)")
-        print(
-            f"  Message: '{self.message[:50]}{'...' if len(self.message) > 50 else ''}'"
+        logger.info(
+            "\n[%.1f] Client: Sending message (%d bytes)", self.now, len(self.data)
+        )
+        logger.info(
+            "  Message: '%s%s'",
+            self.message[:50],
+            "..." if len(self.message) > 50 else "",
         )
-        await self.connection.send(data)
+        await self.connection.send(self.data)
 
         # Wait for transmission to complete
         await self.timeout(2.0)
 
-        print(f"[{self.now:.1f}] Client: Done sending")
+        logger.info("[%.1f] Client: Done sending", self.now)
 
 
 class TCPServer(Process):
@@ -54,44 +63,54 @@ class TCPServer(Process):
         success = await self.connection.listen_and_accept()
 
         if not success:
-            print(f"[{self.now:.1f}] Server: Accept failed")
+            logger.info("[%.1f] Server: Accept failed", self.now)
             return
 
-        print(f"\n[{self.now:.1f}] Server: Connection accepted, waiting for data")
+        logger.info(
+            "\n[%.1f] Server: Connection accepted, waiting for data", self.now
+        )
 
-        # Receive data
-        received_data = b""
+        # Receive data; a bytearray grows in amortized O(1) where
+        # repeated bytes concatenation would recopy the whole stream
+        # for every chunk
+        received_data = bytearray()
         timeout_time = self.now + 15.0
 
         while self.now < timeout_time:
-            try:
-                # Try to get data with timeout
-                name, value = await FirstOf(
-                    self._env,
-                    data=self.connection.receive(),
-                    timeout=Timeout(self._env, 0.5),
-                )
-
-                if name == "data":
-                    chunk = value
-                    received_data += chunk
-                    print(
-                        f"[{self.now:.1f}] Server: Received {len(chunk)} bytes "
-                        f"(total: {len(received_data)})"
-                    )
-                    # Reset timeout
-                    timeout_time = self.now + 15.0
-
-            except Exception:
-                # No data available
-                await self.timeout(0.1)
-
+            # Try to get data with timeout
+            name, value = await FirstOf(
+                self._env,
+                data=self.connection.receive(),
+                timeout=Timeout(self._env, 0.5),
+            )
+
+            if name == "timeout":
+                # No data this round; loop back until the outer deadline
+                continue
+
+            chunk = value
+            received_data.extend(chunk)
+            logger.info(
+                "[%.1f] Server: Received %d bytes (total: %d)",
+                self.now,
+                len(chunk),
+                len(received_data),
+            )
+            # Reset timeout
+            timeout_time = self.now + 15.0
+
+        # One self.now read covers the closing burst of log lines
+        now = self.now
         if received_data:
             message = received_data.decode("utf-8")
-            print(f"\n[{self.now:.1f}] Server: Complete message received:")
-            print(f"  Length: {len(message)} bytes")
-            print(f"  Message: '{message[:100]}{'...' if len(message) > 100 else ''}'")
+            logger.info("\n[%.1f] Server: Complete message received:", now)
+            logger.info("  Length: %d bytes", len(message))
+            logger.info(
+                "  Message: '%s%s'",
+                message[:100],
+                "..." if len(message) > 100 else "",
+            )
         else:
-            print(f"\n[{self.now:.1f}] Server: No data received")
+            logger.info("\n[%.1f] Server: No data received", now)
 
-        print(f"[{self.now:.1f}] Server: Done")
+        logger.info("[%.1f] Server: Done", now)
@@ -1,6 +1,9 @@
 """TCP connection implementation with reliability over unreliable network."""
 
-from asimpy import Process, Queue
+import heapq
+import logging
+from collections import deque
+from asimpy import Event, FirstOf, Process, Queue, Timeout
 from typing import TYPE_CHECKING
 from tcp_types import Packet, PacketType, ConnectionState, SegmentBuffer, ReceiveBuffer
 import random
@@ -8,49 +11,109 @@ import random
 if TYPE_CHECKING:
     from unreliable_network import UnreliableNetwork
 
+logger = logging.getLogger(__name__)
+
 
 # mccole: retransmission
 class RetransmissionTimer(Process):
-    """Timer process for retransmitting unacknowledged segments."""
+    """Single timer process handling all retransmissions for a connection.
+
+    Deadlines live in a min-heap of (deadline, serial, segment) tuples,
+    so one process sleeping until the earliest deadline replaces one
+    process per in-flight segment. The serial breaks ties so segments
+    themselves are never compared.
+    """
 
-    def init(self, connection: "TCPConnection", segment: SegmentBuffer) -> None:
+    def init(self, connection: "TCPConnection") -> None:
         self.connection = connection
-        self.segment = segment
+        self._deadlines: list[tuple[float, int, SegmentBuffer]] = []
+        self._serial = 0
+        self._wake: Event = Event(self._env)
+
+    def track(self, segment: SegmentBuffer) -> None:
+        """Schedule a retransmission deadline for a newly sent segment."""
+        # RFC 6298: consecutive timeouts back the timer off exponentially
+        # so a lost segment does not re-fire at a fixed rate forever
+        connection = self.connection
+        deadline = self.now + min(
+            connection.rto * connection.rto_backoff, connection.rto_max
+        )
+        heapq.heappush(self._deadlines, (deadline, self._serial, segment))
+        self._serial += 1
+        if not self._wake.triggered:
+            self._wake.succeed()
 
     async def run(self) -> None:
-        """Wait for timeout, then retransmit if not acknowledged."""
-        await self.timeout(self.connection.rto)
-
-        # Check if still in send buffer (not yet acknowledged)
-        if self.segment in self.connection.send_buffer:
-            print(
-                f"[{self.now:.1f}] TCP: TIMEOUT - Retransmitting "
-                f"seq={self.segment.seq_num}"
+        """Sleep until the earliest deadline, retransmit if still live."""
+        connection = self.connection
+        while True:
+            if not self._deadlines:
+                # Nothing in flight: wait until track() adds a deadline
+                self._wake = Event(self._env)
+                await self._wake
+                continue
+
+            deadline, _, segment = self._deadlines[0]
+            if deadline > self.now:
+                # Wake early if a nearer deadline is tracked meanwhile
+                self._wake = Event(self._env)
+                await FirstOf(
+                    self._env,
+                    timer=Timeout(self._env, deadline - self.now),
+                    wake=self._wake,
+                )
+                continue
+
+            heapq.heappop(self._deadlines)
+
+            # Skip if already acknowledged (O(1) against the live-seq set)
+            if segment.seq_num not in connection._live_seqs:
+                continue
+
+            logger.info(
+                "[%.1f] TCP: TIMEOUT - Retransmitting seq=%d",
+                self.now,
+                segment.seq_num,
             )
 
-            self.connection.packets_retransmitted += 1
-            self.segment.retransmit_count += 1
-            self.segment.sent_time = self.now
+            connection.packets_retransmitted += 1
+            connection.rto_backoff = min(connection.rto_backoff * 2, 32)
+            segment.retransmit_count += 1
+            segment.sent_time = self.now
 
             # Retransmit
             packet = Packet(
-                src_addr=self.connection.local_addr,
-                dst_addr=self.connection.remote_addr,
-                src_port=self.connection.local_port,
-                dst_port=self.connection.remote_port,
-                seq_num=self.segment.seq_num,
-                ack_num=self.connection.recv_buffer.next_expected_seq,
+                src_addr=connection.local_addr,
+                dst_addr=connection.remote_addr,
+                src_port=connection.local_port,
+                dst_port=connection.remote_port,
+                seq_num=segment.seq_num,
+                ack_num=connection.recv_buffer.next_expected_seq,
                 packet_type=PacketType.DATA,
-                data=self.segment.data,
+                data=segment.data,
             )
 
-            await self.connection.network.send_packet(packet)
+            await connection.network.send_packet(packet)
 
-            # Restart timer
-            RetransmissionTimer(self._env, self.connection, self.segment)
+            # Re-arm with the (now doubled) backoff
+            self.track(segment)
 # mccole: /retransmission
 
 
+class DelayedAckTimer(Process):
+    """One-shot timer that flushes a delayed ACK if still pending."""
+
+    def init(self, connection: "TCPConnection", delay: float) -> None:
+        self.connection = connection
+        self.delay = delay
+
+    async def run(self) -> None:
+        await self.timeout(self.delay)
+        self.connection._ack_timer_running = False
+        if self.connection._unacked_count > 0:
+            await self.connection._send_ack()
+
+
 # mccole: tcpinit
 class TCPConnection(Process):
     """TCP connection with reliability over unreliable network."""
@@ -70,6 +133,8 @@ class TCPConnection(Process):
         self.mtu = mtu  # Maximum transmission unit
         self.window_size = window_size  # Sliding window size
         self.rto = timeout  # Retransmission timeout
+        self.rto_backoff = 1  # Doubles per consecutive timeout (RFC 6298)
+        self.rto_max = 60.0  # Ceiling on the effective timeout
 
         # Connection state
         self.state = ConnectionState.CLOSED
@@ -80,14 +145,25 @@ class TCPConnection(Process):
         self.send_seq = random.randint(1000, 9999)  # Initial sequence number
         self.recv_seq = 0
 
-        # Send buffer
-        self.send_buffer: list[SegmentBuffer] = []
+        # Send buffer: segments enter in sequence order and cumulative
+        # ACKs retire a prefix, so a deque retires in O(1) per segment;
+        # the companion set answers "is this segment still live?" in O(1)
+        self.send_buffer: deque[SegmentBuffer] = deque()
+        self._live_seqs: set[int] = set()
         self.send_base = self.send_seq  # Oldest unacknowledged sequence
         self.next_seq_num = self.send_seq  # Next sequence to use
 
         # Receive buffer
         self.recv_buffer = ReceiveBuffer()
 
+        # Delayed-ACK state: in-order DATA is acknowledged once per two
+        # segments (or when the delay expires), not once per packet
+        self._unacked_count = 0
+        self._ack_timer_running = False
+        # A deferred cumulative ACK that an outgoing DATA segment may
+        # carry in its ack_num field instead of a separate pure ACK
+        self._pending_ack: int | None = None
+
         # Queues
         self.recv_queue: Queue = Queue(self._env)  # Incoming packets
         self.data_ready: Queue = Queue(self._env)  # Data for application
@@ -95,14 +171,26 @@ class TCPConnection(Process):
         # Register with network
         network.register_endpoint(local_addr, local_port, self.recv_queue)
 
+        # One timer process covers every in-flight segment
+        self.retransmit_timer = RetransmissionTimer(self._env, self)
+
+        # Fired once the handshake completes / whenever ACKs open the
+        # send window, so waiters block on the transition itself instead
+        # of polling the state every 0.1 s
+        self._established: Event = Event(self._env)
+        self._window_open: Event = Event(self._env)
+
         # Statistics
         self.bytes_sent = 0
         self.bytes_received = 0
         self.packets_retransmitted = 0
 
-        print(
-            f"[{self.now:.1f}] TCP {self.local_addr}:{self.local_port}: "
-            f"Created (ISN={self.send_seq})"
+        logger.info(
+            "[%.1f] TCP %s:%d: Created (ISN=%d)",
+            self.now,
+            self.local_addr,
+            self.local_port,
+            self.send_seq,
         )
 # mccole: /tcpinit
 
@@ -119,9 +207,11 @@ class TCPConnection(Process):
             await self.handle_syn(packet)
 
         elif packet.packet_type == PacketType.SYN_ACK:
-            print(
-                f"[{self.now:.1f}] TCP: Received SYN-ACK "
-                f"(seq={packet.seq_num}, ack={packet.ack_num})"
+            logger.info(
+                "[%.1f] TCP: Received SYN-ACK (seq=%d, ack=%d)",
+                self.now,
+                packet.seq_num,
+                packet.ack_num,
             )
 
             self.recv_seq = packet.seq_num + 1
@@ -141,18 +231,35 @@ class TCPConnection(Process):
 
             await self.network.send_packet(ack)
             self.state = ConnectionState.ESTABLISHED
-            print(f"[{self.now:.1f}] TCP: Sent ACK, connection established")
+            if not self._established.triggered:
+                self._established.succeed()
+            logger.info("[%.1f] TCP: Sent ACK, connection established", self.now)
 
         elif packet.packet_type == PacketType.ACK:
             if self.state == ConnectionState.SYN_RECEIVED:
-                print(
-                    f"[{self.now:.1f}] TCP: Received final ACK, connection established"
+                logger.info(
+                    "[%.1f] TCP: Received final ACK, connection established",
+                    self.now,
                 )
                 self.state = ConnectionState.ESTABLISHED
+                if not self._established.triggered:
+                    self._established.succeed()
             else:
                 await self.handle_ack(packet)
+            # Pure ACKs carry no payload and are never kept; recycle
+            packet.release()
 
         elif packet.packet_type == PacketType.DATA:
+            if self.state == ConnectionState.SYN_RECEIVED:
+                # The peer only sends data once its side of the
+                # handshake is done, so DATA stands in for a lost
+                # final ACK
+                logger.info(
+                    "[%.1f] TCP: Received DATA, connection established", self.now
+                )
+                self.state = ConnectionState.ESTABLISHED
+                if not self._established.triggered:
+                    self._established.succeed()
             await self.handle_data(packet)
     # mccole: /tcp_run
 
@@ -162,9 +269,11 @@ class TCPConnection(Process):
         self.remote_addr = remote_addr
         self.remote_port = remote_port
 
-        print(
-            f"\n[{self.now:.1f}] TCP: Starting connection to "
-            f"{remote_addr}:{remote_port}"
+        logger.info(
+            "\n[%.1f] TCP: Starting connection to %s:%d",
+            self.now,
+            remote_addr,
+            remote_port,
         )
 
         # Send SYN
@@ -180,18 +289,36 @@ class TCPConnection(Process):
         )
 
         await self.network.send_packet(syn)
-        print(f"[{self.now:.1f}] TCP: Sent SYN (seq={self.send_seq})")
-
-        # Wait for SYN-ACK with timeout
-        timeout_time = self.now + 5.0
-        while self.state != ConnectionState.ESTABLISHED and self.now < timeout_time:
-            await self.timeout(0.1)
+        logger.info("[%.1f] TCP: Sent SYN (seq=%d)", self.now, self.send_seq)
+
+        # Wait for the handshake to complete, retransmitting the SYN
+        # each rto so a single lost handshake packet does not doom the
+        # whole attempt. Each round waits on a fresh Event because
+        # FirstOf cancels the losing side.
+        deadline = self.now + 10.0
+        while self.state != ConnectionState.ESTABLISHED and self.now < deadline:
+            self._established = Event(self._env)
+            name, _ = await FirstOf(
+                self._env,
+                established=self._established,
+                timer=Timeout(self._env, min(self.rto, deadline - self.now)),
+            )
+            if name == "timer" and self.state != ConnectionState.ESTABLISHED:
+                if self.now >= deadline:
+                    break
+                self.packets_retransmitted += 1
+                logger.info(
+                    "[%.1f] TCP: TIMEOUT - Retransmitting SYN (seq=%d)",
+                    self.now,
+                    self.send_seq,
+                )
+                await self.network.send_packet(syn)
 
         if self.state == ConnectionState.ESTABLISHED:
-            print(f"[{self.now:.1f}] TCP: Connection ESTABLISHED\n")
+            logger.info("[%.1f] TCP: Connection ESTABLISHED\n", self.now)
             return True
         else:
-            print(f"[{self.now:.1f}] TCP: Connection FAILED (timeout)\n")
+            logger.info("[%.1f] TCP: Connection FAILED (timeout)\n", self.now)
             self.state = ConnectionState.CLOSED
             return False
     # mccole: /tcpconnect
@@ -199,7 +326,12 @@ class TCPConnection(Process):
     # mccole: server_accept
     async def listen_and_accept(self) -> bool:
         """Listen for incoming connection (server side)."""
-        print(f"[{self.now:.1f}] TCP {self.local_addr}:{self.local_port}: Listening...")
+        logger.info(
+            "[%.1f] TCP %s:%d: Listening...",
+            self.now,
+            self.local_addr,
+            self.local_port,
+        )
 
         # Wait for SYN
         while True:
@@ -208,18 +340,25 @@ class TCPConnection(Process):
                 await self.handle_syn(packet)
                 break
 
-        # Wait for final ACK
-        timeout_time = self.now + 5.0
-        while self.state != ConnectionState.ESTABLISHED and self.now < timeout_time:
-            await self.timeout(0.1)
+        # Wait for final ACK, with timeout. A retransmitted client SYN
+        # re-enters through run(), and handle_syn resends the SYN-ACK.
+        if self.state != ConnectionState.ESTABLISHED:
+            self._established = Event(self._env)
+            await FirstOf(
+                self._env,
+                established=self._established,
+                timeout=Timeout(self._env, 10.0),
+            )
 
         return self.state == ConnectionState.ESTABLISHED
 
     async def handle_syn(self, packet: Packet) -> None:
         """Handle incoming SYN."""
-        print(
-            f"[{self.now:.1f}] TCP: Received SYN from "
-            f"{packet.src_addr}:{packet.src_port}"
+        logger.info(
+            "[%.1f] TCP: Received SYN from %s:%d",
+            self.now,
+            packet.src_addr,
+            packet.src_port,
         )
 
         self.remote_addr = packet.src_addr
@@ -240,9 +379,11 @@ class TCPConnection(Process):
         )
 
         await self.network.send_packet(syn_ack)
-        print(
-            f"[{self.now:.1f}] TCP: Sent SYN-ACK (seq={self.send_seq}, "
-            f"ack={self.recv_seq})"
+        logger.info(
+            "[%.1f] TCP: Sent SYN-ACK (seq=%d, ack=%d)",
+            self.now,
+            self.send_seq,
+            self.recv_seq,
         )
     # mccole: /server_accept
 
@@ -251,18 +392,25 @@ class TCPConnection(Process):
         """Handle ACK packet."""
         ack_num = packet.ack_num
 
-        # Remove acknowledged segments from send buffer
-        acknowledged = []
-        for seg in self.send_buffer[:]:
-            if seg.seq_num < ack_num:
-                acknowledged.append(seg)
-                self.send_buffer.remove(seg)
+        # Retire the acknowledged prefix of the send buffer
+        acknowledged = 0
+        while self.send_buffer and self.send_buffer[0].seq_num < ack_num:
+            seg = self.send_buffer.popleft()
+            self._live_seqs.discard(seg.seq_num)
+            acknowledged += 1
 
         if acknowledged:
             self.send_base = ack_num
-            print(
-                f"[{self.now:.1f}] TCP: ACK {ack_num} "
-                f"(acknowledged {len(acknowledged)} segments)"
+            # Fresh ACK: the path is alive again, reset the backoff
+            self.rto_backoff = 1
+            # Retired segments opened the send window
+            if not self._window_open.triggered:
+                self._window_open.succeed()
+            logger.info(
+                "[%.1f] TCP: ACK %d (acknowledged %d segments)",
+                self.now,
+                ack_num,
+                acknowledged,
             )
     # mccole: /handleack
 
@@ -272,7 +420,13 @@ class TCPConnection(Process):
         seq_num = packet.seq_num
         data = packet.data
 
-        print(f"[{self.now:.1f}] TCP: Received DATA (seq={seq_num}, len={len(data)})")
+        logger.info(
+            "[%.1f] TCP: Received DATA (seq=%d, len=%d)", self.now, seq_num, len(data)
+        )
+
+        # An out-of-order or duplicate segment must be acknowledged at
+        # once so the sender learns what is still missing
+        out_of_order = seq_num != self.recv_buffer.next_expected_seq
 
         # Add to receive buffer
         self.recv_buffer.add_segment(seq_num, data)
@@ -282,84 +436,126 @@ class TCPConnection(Process):
         if continuous_data:
             self.bytes_received += len(continuous_data)
             await self.data_ready.put(continuous_data)
-            print(
-                f"[{self.now:.1f}] TCP: Delivered {len(continuous_data)} "
-                f"bytes to application"
+            logger.info(
+                "[%.1f] TCP: Delivered %d bytes to application",
+                self.now,
+                len(continuous_data),
             )
 
-        # Send ACK
-        ack = Packet(
+        # Delayed ACK: acknowledge every second in-order segment
+        # immediately, otherwise arm a short timer so a lone segment is
+        # still acknowledged promptly. Halves the pure-ACK packets the
+        # network has to route on a bursty transfer.
+        self._unacked_count += 1
+        if self._unacked_count >= 2 or out_of_order:
+            await self._send_ack()
+        elif not self._ack_timer_running:
+            self._pending_ack = self.recv_buffer.next_expected_seq
+            self._ack_timer_running = True
+            DelayedAckTimer(self._env, self, min(0.04, self.rto / 8))
+    # mccole: /handle_data
+
+    async def _send_ack(self) -> None:
+        """Send a cumulative ACK for everything received in order."""
+        self._unacked_count = 0
+        self._pending_ack = None
+        ack = Packet.acquire(
             src_addr=self.local_addr,
-            dst_addr=packet.src_addr,
+            dst_addr=self.remote_addr,
             src_port=self.local_port,
-            dst_port=packet.src_port,
+            dst_port=self.remote_port,
             seq_num=self.next_seq_num,
             ack_num=self.recv_buffer.next_expected_seq,
             packet_type=PacketType.ACK,
         )
 
         await self.network.send_packet(ack)
-        print(
-            f"[{self.now:.1f}] TCP: Sent ACK (ack={self.recv_buffer.next_expected_seq})"
+        logger.info(
+            "[%.1f] TCP: Sent ACK (ack=%d)",
+            self.now,
+            self.recv_buffer.next_expected_seq,
         )
-    # mccole: /handle_data
 
     # mccole: tcpsend
     async def send(self, data: bytes) -> None:
         """Send data reliably using TCP."""
         if self.state != ConnectionState.ESTABLISHED:
-            print(f"[{self.now:.1f}] TCP: Cannot send - not connected")
+            logger.info("[%.1f] TCP: Cannot send - not connected", self.now)
             return
 
-        # Split data into segments (respecting MTU)
+        # Split data into segments and send a window's worth at a time
         offset = 0
         while offset < len(data):
-            chunk = data[offset : offset + self.mtu]
-
-            # Wait if send window is full
+            # Wait for an ACK to open the send window
             while len(self.send_buffer) >= self.window_size:
-                await self.timeout(0.1)
-
-            # Create and send segment
-            seq_num = self.next_seq_num
-            segment = Packet(
-                src_addr=self.local_addr,
-                dst_addr=self.remote_addr,
-                src_port=self.local_port,
-                dst_port=self.remote_port,
-                seq_num=seq_num,
-                ack_num=self.recv_buffer.next_expected_seq,
-                packet_type=PacketType.DATA,
-                data=chunk,
-            )
-
-            await self.network.send_packet(segment)
+                self._window_open = Event(self._env)
+                await self._window_open
+
+            # Piggyback any deferred ACK: every DATA segment already
+            # carries the cumulative ack_num, so the queued pure ACK
+            # becomes redundant and is dropped
+            if self._pending_ack is not None:
+                self._pending_ack = None
+                self._unacked_count = 0
+
+            # Fill the open window with segments
+            batch = []
+            room = self.window_size - len(self.send_buffer)
+            while offset < len(data) and len(batch) < room:
+                chunk = data[offset : offset + self.mtu]
+                seq_num = self.next_seq_num
+                segment = Packet(
+                    src_addr=self.local_addr,
+                    dst_addr=self.remote_addr,
+                    src_port=self.local_port,
+                    dst_port=self.remote_port,
+                    seq_num=seq_num,
+                    ack_num=self.recv_buffer.next_expected_seq,
+                    packet_type=PacketType.DATA,
+                    data=chunk,
+                )
+                batch.append(segment)
 
-            # Add to send buffer for potential retransmission
-            buffer_entry = SegmentBuffer(
-                seq_num=seq_num, data=chunk, sent_time=self.now
-            )
-            self.send_buffer.append(buffer_entry)
+                # Add to send buffer for potential retransmission
+                buffer_entry = SegmentBuffer(
+                    seq_num=seq_num, data=chunk, sent_time=self.now
+                )
+                self.send_buffer.append(buffer_entry)
+                self._live_seqs.add(seq_num)
 
-            self.next_seq_num += len(chunk)
-            self.bytes_sent += len(chunk)
+                # Schedule a retransmission deadline for this segment
+                self.retransmit_timer.track(buffer_entry)
 
-            print(f"[{self.now:.1f}] TCP: Sent DATA (seq={seq_num}, len={len(chunk)})")
+                self.next_seq_num += len(chunk)
+                self.bytes_sent += len(chunk)
+                offset += len(chunk)
 
-            # Start retransmission timer for this segment
-            RetransmissionTimer(self._env, self, buffer_entry)
+                logger.info(
+                    "[%.1f] TCP: Sent DATA (seq=%d, len=%d)",
+                    self.now,
+                    seq_num,
+                    len(chunk),
+                )
 
-            offset += len(chunk)
+            # One network call (and one shared delay) for the burst
+            await self.network.send_packets(batch)
     # mccole: /tcpsend
 
-    async def receive(self) -> bytes:
-        """Receive data from connection."""
-        return await self.data_ready.get()
+    def receive(self) -> Event:
+        """Return an event that resolves to the next delivered data.
+
+        Returning the queue's get event (rather than awaiting it here)
+        lets callers race it in a FirstOf; a cancelled get puts the data
+        back, so losing the race never drops a chunk.
+        """
+        return self.data_ready.get()
 
     def print_statistics(self) -> None:
         """Print connection statistics."""
-        print(f"### TCP Connection Statistics ({self.local_addr}:{self.local_port}):")
-        print(f"Bytes sent: {self.bytes_sent}")
-        print(f"Bytes received: {self.bytes_received}")
-        print(f"Packets retransmitted: {self.packets_retransmitted}")
-        print(f"Send buffer size: {len(self.send_buffer)}")
+        logger.info(
+            "### TCP Connection Statistics (%s:%d):", self.local_addr, self.local_port
+        )
+        logger.info("Bytes sent: %d", self.bytes_sent)
+        logger.info("Bytes received: %d", self.bytes_received)
+        logger.info("Packets retransmitted: %d", self.packets_retransmitted)
+        logger.info("Send buffer size: %d", len(self.send_buffer))
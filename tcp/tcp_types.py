@@ -1,5 +1,6 @@
 """Data types for TCP over UDP implementation."""
 
+import bisect
 from dataclasses import dataclass, field
 from enum import Enum
 
@@ -31,8 +32,12 @@ class ConnectionState(Enum):
 # mccole: /connectionstate
 
 
+# Free list of released packets awaiting reuse (see Packet.acquire)
+_packet_pool: list["Packet"] = []
+
+
 # mccole: packet
-@dataclass
+@dataclass(slots=True)
 class Packet:
     """A network packet (simulating IP + TCP)."""
 
@@ -54,8 +59,61 @@ class Packet:
             f"ack={self.ack_num}, len={data_len})"
         )
 
+    @classmethod
+    def acquire(
+        cls,
+        src_addr: str,
+        src_port: int,
+        dst_addr: "str | None",
+        dst_port: "int | None",
+        seq_num: int,
+        ack_num: int,
+        packet_type: PacketType,
+        data: bytes = b"",
+        window_size: int = 65535,
+    ) -> "Packet":
+        """Take a packet from the free list, or allocate a fresh one.
+
+        Short-lived control packets (pure ACKs) churn through the
+        allocator on the hot path; recycling released instances skips
+        that. The caller that finishes with an acquired packet should
+        hand it back with release().
+        """
+        if _packet_pool:
+            packet = _packet_pool.pop()
+            packet.src_addr = src_addr
+            packet.src_port = src_port
+            packet.dst_addr = dst_addr
+            packet.dst_port = dst_port
+            packet.seq_num = seq_num
+            packet.ack_num = ack_num
+            packet.packet_type = packet_type
+            packet.data = data
+            packet.window_size = window_size
+            return packet
+        return cls(
+            src_addr=src_addr,
+            src_port=src_port,
+            dst_addr=dst_addr,
+            dst_port=dst_port,
+            seq_num=seq_num,
+            ack_num=ack_num,
+            packet_type=packet_type,
+            data=data,
+            window_size=window_size,
+        )
+
+    def release(self) -> None:
+        """Return this packet to the free list for reuse.
+
+        Only call this once the packet cannot be referenced again; the
+        network copies duplicated packets so no object is ever delivered
+        (and hence released) twice.
+        """
+        _packet_pool.append(self)
 
-@dataclass
+
+@dataclass(slots=True)
 class SegmentBuffer:
     """Buffer for sent but unacknowledged segments."""
 
@@ -69,34 +127,67 @@ class SegmentBuffer:
 
 
 # mccole: receivebuffer
-@dataclass
+@dataclass(slots=True)
 class ReceiveBuffer:
-    """Buffer for out-of-order received segments."""
-
-    segments: dict[int, bytes] = field(default_factory=dict)
+    """Buffer for out-of-order received segments.
+
+    Segments are coalesced into runs of contiguous data as they arrive:
+    each run keeps its chunks in a list, so adjacent segments merge by
+    appending instead of copying, and delivering a run is one pop no
+    matter how many segments it was assembled from.
+    """
+
+    # Sorted run start sequences, with each run's chunk list and end
+    # sequence keyed by its start
+    _starts: list[int] = field(default_factory=list)
+    _chunks: dict[int, list[bytes]] = field(default_factory=dict)
+    _ends: dict[int, int] = field(default_factory=dict)
     next_expected_seq: int = 0
 
     def add_segment(self, seq_num: int, data: bytes) -> None:
-        """Add a segment to the receive buffer."""
-        if seq_num >= self.next_expected_seq:
-            self.segments[seq_num] = data
+        """Add a segment, merging it into adjacent runs where possible."""
+        if seq_num < self.next_expected_seq:
+            return
+
+        # Find the nearest run starting at or before this segment
+        i = bisect.bisect_right(self._starts, seq_num) - 1
+        if i >= 0:
+            prev_start = self._starts[i]
+            if seq_num < self._ends[prev_start]:
+                return  # Duplicate: already inside a buffered run
+            if seq_num == self._ends[prev_start]:
+                # Extends the previous run; no data is copied
+                self._chunks[prev_start].append(data)
+                self._ends[prev_start] = seq_num + len(data)
+                self._merge_next(i)
+                return
+
+        # Start a new run, then merge a now-adjacent successor
+        self._starts.insert(i + 1, seq_num)
+        self._chunks[seq_num] = [data]
+        self._ends[seq_num] = seq_num + len(data)
+        self._merge_next(i + 1)
+
+    def _merge_next(self, i: int) -> None:
+        """Fold the run after position i into it if they now touch."""
+        start = self._starts[i]
+        if i + 1 < len(self._starts) and self._starts[i + 1] == self._ends[start]:
+            following = self._starts.pop(i + 1)
+            self._chunks[start].extend(self._chunks.pop(following))
+            self._ends[start] = self._ends.pop(following)
 
     def get_continuous_data(self) -> bytes:
         """Extract continuous data starting from next_expected_seq."""
-        result = b""
-        current_seq = self.next_expected_seq
-
-        while current_seq in self.segments:
-            segment = self.segments.pop(current_seq)
-            result += segment
-            current_seq += len(segment)
-
-        if result:
-            self.next_expected_seq = current_seq
+        if not self._starts or self._starts[0] != self.next_expected_seq:
+            return b""
 
-        return result
+        # The first run is the whole contiguous prefix: pop it once
+        start = self._starts.pop(0)
+        parts = self._chunks.pop(start)
+        self.next_expected_seq = self._ends.pop(start)
+        return parts[0] if len(parts) == 1 else b"".join(parts)
 
     def has_data(self) -> bool:
         """Check if buffer has any segments."""
-        return len(self.segments) > 0
+        return len(self._starts) > 0
 # mccole: /receivebuffer
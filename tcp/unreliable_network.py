@@ -1,10 +1,15 @@
 """Unreliable network layer simulating UDP-like behavior."""
 
-from asimpy import Process, Queue
-from typing import Dict
+import heapq
+import logging
+from asimpy import Event, FirstOf, Process, Queue, Timeout
+from dataclasses import replace
+from typing import Dict, List, Tuple
 from tcp_types import Packet
 import random
 
+logger = logging.getLogger(__name__)
+
 
 # mccole: network_init
 class UnreliableNetwork(Process):
@@ -22,8 +27,24 @@ class UnreliableNetwork(Process):
         self.duplicate_rate = duplicate_rate
         self.delay_range = delay_range
 
-        # Network endpoints (address:port -> queue)
-        self.endpoints: Dict[str, Queue] = {}
+        # Loss, duplication, and reordering are rare and mutually
+        # exclusive per packet, so one uniform draw compared against
+        # cumulative thresholds replaces three RNG calls
+        self._t_loss = loss_rate
+        self._t_dup = loss_rate + duplicate_rate
+        self._t_reorder = self._t_dup + reorder_rate
+        self._delay_low = delay_range[0]
+        self._delay_span = delay_range[1] - delay_range[0]
+
+        # Network endpoints ((address, port) -> queue); tuple keys avoid
+        # formatting a fresh string for every routed packet
+        self.endpoints: Dict[Tuple[str, int], Queue] = {}
+
+        # In-flight packets as a min-heap of (deliver_time, serial,
+        # packet); the serial breaks ties so packets never compare
+        self._outbound: list = []
+        self._serial = 0
+        self._wake: Event = Event(self._env)
 
         # Statistics
         self.packets_sent = 0
@@ -31,21 +52,54 @@ class UnreliableNetwork(Process):
         self.packets_reordered = 0
         self.packets_duplicated = 0
 
-        print(
-            f"[{self.now:.1f}] Network: Started (loss={loss_rate:.0%}, "
-            f"reorder={reorder_rate:.0%})"
+        logger.info(
+            "[%.1f] Network: Started (loss=%.0f%%, reorder=%.0f%%)",
+            self.now,
+            loss_rate * 100,
+            reorder_rate * 100,
         )
 
     async def run(self) -> None:
-        """Network doesn't have a main loop - just routes packets."""
+        """Deliver in-flight packets when their delay expires.
+
+        Senders enqueue packets with a scheduled delivery time and move
+        on; this reactor loop sleeps until the earliest deadline, so no
+        sender ever blocks behind a simulated network delay.
+        """
         while True:
-            await self.timeout(1000)  # Sleep forever
+            if not self._outbound:
+                # Nothing in flight: wait until a sender enqueues
+                self._wake = Event(self._env)
+                await self._wake
+                continue
+
+            deliver_time, _, packet = self._outbound[0]
+            if deliver_time > self.now:
+                # Wake early if a nearer delivery is scheduled meanwhile
+                self._wake = Event(self._env)
+                await FirstOf(
+                    self._env,
+                    timer=Timeout(self._env, deliver_time - self.now),
+                    wake=self._wake,
+                )
+                continue
+
+            heapq.heappop(self._outbound)
+            queue = self.endpoints.get((packet.dst_addr, packet.dst_port))
+            if queue is not None:
+                await queue.put(packet)
+            else:
+                logger.info(
+                    "[%.1f] Network: No endpoint for %s:%s",
+                    self.now,
+                    packet.dst_addr,
+                    packet.dst_port,
+                )
 
     def register_endpoint(self, address: str, port: int, queue: Queue) -> None:
         """Register an endpoint to receive packets."""
-        endpoint_id = f"{address}:{port}"
-        self.endpoints[endpoint_id] = queue
-        print(f"[{self.now:.1f}] Network: Registered {endpoint_id}")
+        self.endpoints[address, port] = queue
+        logger.info("[%.1f] Network: Registered %s:%d", self.now, address, port)
 # mccole: /network_init
 
     # mccole: network_send
@@ -53,48 +107,96 @@ class UnreliableNetwork(Process):
         """Send packet with simulated unreliability."""
         self.packets_sent += 1
 
-        # Simulate packet loss
-        if random.random() < self.loss_rate:
+        # Two draws per packet: one for the transit delay and one fate
+        # draw compared against the cumulative thresholds (lost,
+        # duplicated, reordered, or delivered normally)
+        delay = self._delay_low + random.random() * self._delay_span
+        fate = random.random()
+
+        if fate < self._t_loss:
             self.packets_lost += 1
-            print(f"[{self.now:.1f}] Network: LOST {packet}")
+            logger.info("[%.1f] Network: LOST %s", self.now, packet)
             return
 
-        # Simulate packet duplication
-        if random.random() < self.duplicate_rate:
+        if fate < self._t_dup:
             self.packets_duplicated += 1
-            print(f"[{self.now:.1f}] Network: DUPLICATING {packet}")
-            await self._deliver_packet(packet)
+            logger.info("[%.1f] Network: DUPLICATING %s", self.now, packet)
+            # Deliver a copy so receivers never see (or release) the
+            # same Packet object twice
+            self._schedule(replace(packet), delay)
 
         # Deliver the packet
-        await self._deliver_packet(packet)
+        self._schedule(
+            packet, delay, reordered=self._t_dup <= fate < self._t_reorder
+        )
 
-    async def _deliver_packet(self, packet: Packet) -> None:
-        """Deliver packet to destination."""
-        # Simulate network delay
-        delay = random.uniform(*self.delay_range)
+    async def send_packets(self, packets: List[Packet]) -> None:
+        """Send a burst of packets sharing one simulated delay.
 
-        # Simulate reordering by adding extra random delay
+        Loss and duplication are still decided per packet, but the whole
+        burst rides a single delay (and a single reorder draw) instead
+        of scheduling one timeout per packet, the way sendmmsg hands a
+        batch to the kernel in one call.
+        """
+        surviving = []
+        for packet in packets:
+            self.packets_sent += 1
+
+            # One draw per packet against the cumulative thresholds
+            fate = random.random()
+
+            if fate < self._t_loss:
+                self.packets_lost += 1
+                logger.info("[%.1f] Network: LOST %s", self.now, packet)
+                continue
+
+            if fate < self._t_dup:
+                self.packets_duplicated += 1
+                logger.info("[%.1f] Network: DUPLICATING %s", self.now, packet)
+                # Deliver a copy so receivers never see (or release)
+                # the same Packet object twice
+                surviving.append(replace(packet))
+
+            surviving.append(packet)
+
+        if not surviving:
+            return
+
+        # One shared delay for the burst
+        delay = self._delay_low + random.random() * self._delay_span
         if random.random() < self.reorder_rate:
             self.packets_reordered += 1
-            delay += random.uniform(0.2, 0.8)
+            delay += 0.2 + random.random() * 0.6
 
-        await self.timeout(delay)
+        deliver_time = self.now + delay
+        for packet in surviving:
+            self._enqueue(deliver_time, packet)
 
-        # Find destination endpoint
-        endpoint_id = f"{packet.dst_addr}:{packet.dst_port}"
-        if endpoint_id in self.endpoints:
-            await self.endpoints[endpoint_id].put(packet)
-        else:
-            print(f"[{self.now:.1f}] Network: No endpoint for {endpoint_id}")
+    def _schedule(self, packet: Packet, delay: float, reordered: bool = False) -> None:
+        """Queue a packet for delivery after the given transit delay."""
+        # Simulate reordering by adding extra random delay
+        if reordered:
+            self.packets_reordered += 1
+            delay += 0.2 + random.random() * 0.6
+
+        self._enqueue(self.now + delay, packet)
     # mccole: /network_send
 
+    def _enqueue(self, deliver_time: float, packet: Packet) -> None:
+        """Hand a packet to the delivery reactor."""
+        heapq.heappush(self._outbound, (deliver_time, self._serial, packet))
+        self._serial += 1
+        if not self._wake.triggered:
+            self._wake.succeed()
+
     def print_statistics(self) -> None:
         """Print network statistics."""
-        print("### Network Statistics:")
-        print(f"Packets sent: {self.packets_sent}")
-        print(
-            f"Packets lost: {self.packets_lost} "
-            f"({100 * self.packets_lost / max(self.packets_sent, 1):.1f}%)"
+        logger.info("### Network Statistics:")
+        logger.info("Packets sent: %d", self.packets_sent)
+        logger.info(
+            "Packets lost: %d (%.1f%%)",
+            self.packets_lost,
+            100 * self.packets_lost / max(self.packets_sent, 1),
         )
-        print(f"Packets reordered: {self.packets_reordered}")
-        print(f"Packets duplicated: {self.packets_duplicated}")
+        logger.info("Packets reordered: %d", self.packets_reordered)
+        logger.info("Packets duplicated: %d", self.packets_duplicated)
@@ -1,5 +1,7 @@
 """Data types for BitTorrent protocol implementation."""
 
+import os
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from typing import List, Any
 from asimpy import Queue
@@ -7,7 +9,7 @@ import hashlib
 
 
 # mccole: file_types
-@dataclass
+@dataclass(slots=True)
 class Piece:
     """A piece of the file being shared."""
 
@@ -21,7 +23,18 @@ class Piece:
         return computed_hash == self.hash_value
 
 
-@dataclass
+def verify_all(pieces: List[Piece]) -> List[bool]:
+    """Verify many pieces in parallel, one result per piece.
+
+    hashlib releases the GIL while hashing buffers bigger than 2 KB, so
+    spreading the SHA-1 calls over a thread pool uses every core for
+    bulk end-of-download verification instead of hashing serially.
+    """
+    with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+        return list(executor.map(Piece.verify, pieces))
+
+
+@dataclass(slots=True)
 class TorrentMetadata:
     """Metadata from .torrent file."""
 
@@ -37,7 +50,7 @@ class TorrentMetadata:
         return f"Torrent({self.file_name}, {self.total_pieces} pieces)"
 
 
-@dataclass
+@dataclass(slots=True)
 class PeerInfo:
     """Information about a peer."""
 
@@ -59,7 +72,7 @@ class PeerInfo:
 
 
 # mccole: message_types
-@dataclass
+@dataclass(slots=True)
 class TrackerRequest:
     """Request to tracker."""
 
@@ -76,7 +89,7 @@ class TrackerRequest:
         return f"TrackerReq(peer={self.peer_id}, event={self.event})"
 
 
-@dataclass
+@dataclass(slots=True)
 class TrackerResponse:
     """Response from tracker."""
 
@@ -87,7 +100,7 @@ class TrackerResponse:
         return f"TrackerResp({len(self.peers)} peers)"
 
 
-@dataclass
+@dataclass(slots=True)
 class PeerMessage:
     """Message exchanged between peers."""
 
@@ -105,17 +118,26 @@ class PeerMessage:
         return f"Msg({self.msg_type})"
 
 
-@dataclass
+@dataclass(slots=True)
 class BitfieldMessage:
-    """Bitfield indicating which pieces a peer has."""
+    """Bitfield indicating which pieces a peer has.
 
-    bitfield: List[bool]  # True if peer has piece at that index
+    Stored as a single int bitmask: bit i is set if the peer has piece
+    i, matching the packed wire format and making membership tests and
+    counting cheap bit operations.
+    """
+
+    num_pieces: int
+    bits: int = 0  # Bit i set if peer has piece at index i
 
     def has_piece(self, index: int) -> bool:
         """Check if peer has a specific piece."""
-        return index < len(self.bitfield) and self.bitfield[index]
+        return 0 <= index < self.num_pieces and (self.bits >> index) & 1 == 1
+
+    def set_piece(self, index: int) -> None:
+        """Record that the peer has a specific piece."""
+        self.bits |= 1 << index
 
     def __str__(self) -> str:
-        count = sum(1 for b in self.bitfield if b)
-        return f"Bitfield({count}/{len(self.bitfield)} pieces)"
+        return f"Bitfield({self.bits.bit_count()}/{self.num_pieces} pieces)"
 # mccole: /message_types
@@ -1,5 +1,8 @@
 """Basic BitTorrent protocol demonstration."""
 
+import logging
+import sys
+
 from asimpy import Environment
 from typing import List
 from tracker import Tracker
@@ -10,6 +13,7 @@ from bittorrent_types import TorrentMetadata
 # mccole: basicexample
 def run_basic_bittorrent() -> None:
     """Demonstrate basic BitTorrent operation."""
+    logging.basicConfig(level=logging.INFO, format="%(message)s", stream=sys.stdout)
     env = Environment()
 
     # Create tracker
@@ -28,6 +32,10 @@ def run_basic_bittorrent() -> None:
 
     print(f"[{env.now:.1f}] Created {metadata}\n")
 
+    # Shared swarm-wide piece availability counts and holder index
+    availability = [0] * metadata.total_pieces
+    piece_holders = [set() for _ in range(metadata.total_pieces)]
+
     # Create initial seeder with all pieces
     peers: List[SimplifiedPeer] = []
     seeder = SimplifiedPeer(
@@ -37,20 +45,25 @@ def run_basic_bittorrent() -> None:
         tracker,
         peers,
         initial_pieces=list(range(10)),  # Has all pieces
+        availability=availability,
+        piece_holders=piece_holders,
     )
     peers.append(seeder)
 
     # Create leechers with no pieces
     for i in range(3):
         peer = SimplifiedPeer(
-            env, f"Peer{i + 1}", metadata, tracker, peers, initial_pieces=[]
+            env,
+            f"Peer{i + 1}",
+            metadata,
+            tracker,
+            peers,
+            initial_pieces=[],
+            availability=availability,
+            piece_holders=piece_holders,
         )
         peers.append(peer)
 
-    # Update peer lists
-    for peer in peers:
-        peer.other_peers = [p for p in peers if p != peer]
-
     # Run simulation
     env.run(until=30)
 
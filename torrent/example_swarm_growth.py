@@ -1,5 +1,8 @@
 """Demonstration of swarm growth and piece propagation."""
 
+import logging
+import sys
+
 from asimpy import Environment, Process
 from typing import List
 from tracker import Tracker
@@ -15,10 +18,14 @@ class PeerJoiner(Process):
         metadata: TorrentMetadata,
         tracker: Tracker,
         peers_list: List[SimplifiedPeer],
+        availability: List[int],
+        piece_holders: List[set],
     ) -> None:
         self.metadata = metadata
         self.tracker = tracker
         self.peers_list = peers_list
+        self.availability = availability
+        self.piece_holders = piece_holders
         self.peer_counter = 1
 
     async def run(self) -> None:
@@ -34,17 +41,18 @@ class PeerJoiner(Process):
                 self.tracker,
                 self.peers_list,
                 initial_pieces=[],
+                availability=self.availability,
+                piece_holders=self.piece_holders,
             )
+            # Appending to the shared swarm list is all it takes: every
+            # peer sees the newcomer on its next download round
             self.peers_list.append(new_peer)
             self.peer_counter += 1
 
-            # Update all peer lists
-            for peer in self.peers_list:
-                peer.other_peers = [p for p in self.peers_list if p != peer]
-
 
 def run_swarm_growth() -> None:
     """Demonstrate swarm growth over time."""
+    logging.basicConfig(level=logging.INFO, format="%(message)s", stream=sys.stdout)
     env = Environment()
 
     # Create tracker
@@ -63,15 +71,26 @@ def run_swarm_growth() -> None:
 
     print(f"[{env.now:.1f}] Created {metadata}\n")
 
+    # Shared swarm-wide piece availability counts and holder index
+    availability = [0] * metadata.total_pieces
+    piece_holders = [set() for _ in range(metadata.total_pieces)]
+
     # Create initial seeder
     peers: List[SimplifiedPeer] = []
     seeder = SimplifiedPeer(
-        env, "Seeder", metadata, tracker, peers, initial_pieces=list(range(20))
+        env,
+        "Seeder",
+        metadata,
+        tracker,
+        peers,
+        initial_pieces=list(range(20)),
+        availability=availability,
+        piece_holders=piece_holders,
     )
     peers.append(seeder)
 
     # Create process that adds peers over time
-    PeerJoiner(env, metadata, tracker, peers)
+    PeerJoiner(env, metadata, tracker, peers, availability, piece_holders)
 
     # Run simulation
     env.run(until=40)
@@ -1,13 +1,16 @@
 """Simplified BitTorrent peer for simulation."""
 
+import logging
 from asimpy import Process
-from typing import List, Set, Dict, Optional, TYPE_CHECKING
+from typing import List, Set, Optional, TYPE_CHECKING
 from bittorrent_types import TorrentMetadata
 import random
 
 if TYPE_CHECKING:
     from tracker import Tracker
 
+logger = logging.getLogger(__name__)
+
 
 # mccole: peer_init
 class SimplifiedPeer(Process):
@@ -18,29 +21,73 @@ class SimplifiedPeer(Process):
         peer_id: str,
         metadata: TorrentMetadata,
         tracker: "Tracker",
-        other_peers: List["SimplifiedPeer"],
+        swarm: List["SimplifiedPeer"],
         initial_pieces: Optional[List[int]] = None,
+        availability: Optional[List[int]] = None,
+        piece_holders: Optional[List[Set["SimplifiedPeer"]]] = None,
     ) -> None:
         self.peer_id = peer_id
         self.metadata = metadata
         self.tracker = tracker
-        self.other_peers = other_peers
 
-        # Which pieces we have (just indices for simplicity)
+        # Every peer shares one swarm list; appends by the driver are
+        # visible to all, so nobody maintains a private copy
+        self.swarm = swarm
+        self._other_peers: List["SimplifiedPeer"] = []
+        self._other_peers_size = -1
+
+        # Which pieces we have (just indices for simplicity), and the
+        # complement kept up to date as pieces arrive so download rounds
+        # never rescan the full piece range
         self.have_pieces: Set[int] = set(initial_pieces) if initial_pieces else set()
+        self.needed: Set[int] = set(range(metadata.total_pieces)) - self.have_pieces
+
+        # Swarm-wide copy count per piece, shared by every peer and
+        # updated as pieces arrive, so rarest-first ranking never has to
+        # rescan every peer's holdings
+        if availability is None:
+            availability = [0] * metadata.total_pieces
+        self.availability = availability
+
+        # Swarm-wide inverted index mapping each piece to the peers
+        # holding it, so finding a source is one set lookup instead of a
+        # scan over every peer
+        if piece_holders is None:
+            piece_holders = [set() for _ in range(metadata.total_pieces)]
+        self.piece_holders = piece_holders
+
+        for piece_idx in self.have_pieces:
+            availability[piece_idx] += 1
+            piece_holders[piece_idx].add(self)
 
         # Statistics
         self.downloaded_pieces = len(self.have_pieces)
         self.uploaded_pieces = 0
 
-        print(
-            f"[{self.now:.1f}] Peer {self.peer_id}: Started with "
-            f"{len(self.have_pieces)}/{metadata.total_pieces} pieces"
+        logger.info(
+            "[%.1f] Peer %s: Started with %d/%d pieces",
+            self.now,
+            self.peer_id,
+            len(self.have_pieces),
+            metadata.total_pieces,
         )
 
+    @property
+    def other_peers(self) -> List["SimplifiedPeer"]:
+        """Everyone in the swarm except ourselves.
+
+        Recomputed only when the swarm has grown since the last call, so
+        a joining peer costs each peer one O(N) rebuild on its next
+        round rather than the driver rebuilding N lists per join.
+        """
+        if self._other_peers_size != len(self.swarm):
+            self._other_peers = [p for p in self.swarm if p is not self]
+            self._other_peers_size = len(self.swarm)
+        return self._other_peers
+
     def is_complete(self) -> bool:
         """Check if download is complete."""
-        return len(self.have_pieces) == self.metadata.total_pieces
+        return not self.needed
     # mccole: /peer_init
 
     # mccole: peer_run
@@ -54,7 +101,7 @@ class SimplifiedPeer(Process):
             await self.download_round()
             await self.timeout(1.0)
 
-        print(f"[{self.now:.1f}] Peer {self.peer_id}: ✓ Download complete!")
+        logger.info("[%.1f] Peer %s: ✓ Download complete!", self.now, self.peer_id)
 
         # Announce completion
         await self.announce("completed")
@@ -64,34 +111,33 @@ class SimplifiedPeer(Process):
 
     async def announce(self, event: str) -> None:
         """Simplified tracker announce."""
-        print(f"[{self.now:.1f}] Peer {self.peer_id}: Announcing '{event}' to tracker")
+        logger.info(
+            "[%.1f] Peer %s: Announcing '%s' to tracker", self.now, self.peer_id, event
+        )
     # mccole: /peer_run
 
     # mccole: peer_download_round
     async def download_round(self) -> None:
         """Attempt to download pieces from peers."""
-        needed = [
-            i for i in range(self.metadata.total_pieces) if i not in self.have_pieces
-        ]
-
-        if not needed:
+        if not self.needed:
             return
 
-        # Rarest first
-        piece_counts: Dict[int, int] = {}
-        for peer in self.other_peers:
-            for piece_idx in peer.have_pieces:
-                piece_counts[piece_idx] = piece_counts.get(piece_idx, 0) + 1
-
-        needed.sort(key=lambda idx: piece_counts.get(idx, 0))
+        # Rarest first: the shared availability list already holds the
+        # swarm-wide copy count for every piece. (Our own contribution
+        # is zero for any piece we still need, so ranking matches a scan
+        # over the other peers.) Sorting by index first keeps ties in
+        # index order, as the old full-range scan produced.
+        needed = sorted(self.needed)
+        needed.sort(key=self.availability.__getitem__)
 
         # Try to download rarest piece we need
         for piece_idx in needed[:3]:
-            # Find peer with this piece
-            candidates = [p for p in self.other_peers if piece_idx in p.have_pieces]
+            # The inverted index already knows who holds this piece (we
+            # never hold a piece we still need, so self is never in it)
+            candidates = self.piece_holders[piece_idx]
 
             if candidates:
-                peer = random.choice(candidates)
+                peer = random.choice(tuple(candidates))
                 await self.download_piece_from(peer, piece_idx)
                 break
     # mccole: /peer_download_round
@@ -103,12 +149,19 @@ class SimplifiedPeer(Process):
         await self.timeout(0.2)
 
         self.have_pieces.add(piece_idx)
+        self.needed.discard(piece_idx)
+        self.availability[piece_idx] += 1
+        self.piece_holders[piece_idx].add(self)
         self.downloaded_pieces += 1
         peer.uploaded_pieces += 1
 
-        print(
-            f"[{self.now:.1f}] Peer {self.peer_id}: Downloaded piece {piece_idx} "
-            f"from {peer.peer_id} ({len(self.have_pieces)}/"
-            f"{self.metadata.total_pieces})"
+        logger.info(
+            "[%.1f] Peer %s: Downloaded piece %d from %s (%d/%d)",
+            self.now,
+            self.peer_id,
+            piece_idx,
+            peer.peer_id,
+            len(self.have_pieces),
+            self.metadata.total_pieces,
         )
     # mccole: /peer_download_from
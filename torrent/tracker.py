@@ -1,10 +1,13 @@
 """BitTorrent tracker implementation."""
 
+import logging
 from asimpy import Process, Queue
-from typing import Dict, Set
+from typing import Dict
 from bittorrent_types import TrackerRequest, TrackerResponse, PeerInfo
 import random
 
+logger = logging.getLogger(__name__)
+
 
 # mccole: tracker_init
 class Tracker(Process):
@@ -13,13 +16,14 @@ class Tracker(Process):
     def init(self) -> None:
         self.request_queue: Queue = Queue(self._env)
 
-        # Track peers for each torrent (by info_hash)
-        self.swarms: Dict[str, Set[PeerInfo]] = {}
+        # Track peers for each torrent (by info_hash), each swarm keyed
+        # by peer_id so announces never build a PeerInfo just to hash it
+        self.swarms: Dict[str, Dict[str, PeerInfo]] = {}
 
         # Track when peers were last seen
         self.peer_last_seen: Dict[str, float] = {}
 
-        print(f"[{self.now:.1f}] Tracker started")
+        logger.info("[%.1f] Tracker started", self.now)
 
     async def run(self) -> None:
         """Main tracker loop."""
@@ -31,42 +35,65 @@ class Tracker(Process):
     # mccole: tracker_handle
     async def handle_request(self, request: TrackerRequest) -> None:
         """Handle tracker announce request."""
-        print(f"[{self.now:.1f}] Tracker: Received {request}")
+        logger.info("[%.1f] Tracker: Received %s", self.now, request)
 
         # Initialize swarm if needed
         if request.info_hash not in self.swarms:
-            self.swarms[request.info_hash] = set()
+            self.swarms[request.info_hash] = {}
 
         swarm = self.swarms[request.info_hash]
 
-        # Create peer info
-        peer = PeerInfo(
-            peer_id=request.peer_id, ip_address="127.0.0.1", port=request.port
-        )
-
         # Handle different events
         if request.event == "started" or request.event == "":
-            swarm.add(peer)
+            # A re-announce reuses the registered PeerInfo
+            if request.peer_id not in swarm:
+                swarm[request.peer_id] = PeerInfo(
+                    peer_id=request.peer_id,
+                    ip_address="127.0.0.1",
+                    port=request.port,
+                )
             self.peer_last_seen[request.peer_id] = self.now
-            print(
-                f"[{self.now:.1f}] Tracker: Added {peer.peer_id} to swarm "
-                f"(total: {len(swarm)})"
+            logger.info(
+                "[%.1f] Tracker: Added %s to swarm (total: %d)",
+                self.now,
+                request.peer_id,
+                len(swarm),
             )
 
         elif request.event == "stopped":
-            swarm.discard(peer)
-            print(f"[{self.now:.1f}] Tracker: Removed {peer.peer_id} from swarm")
+            swarm.pop(request.peer_id, None)
+            logger.info(
+                "[%.1f] Tracker: Removed %s from swarm", self.now, request.peer_id
+            )
 
         elif request.event == "completed":
             self.peer_last_seen[request.peer_id] = self.now
-            print(f"[{self.now:.1f}] Tracker: {peer.peer_id} completed download")
-
-        # Return list of other peers
-        other_peers = [p for p in swarm if p.peer_id != request.peer_id]
+            logger.info(
+                "[%.1f] Tracker: %s completed download", self.now, request.peer_id
+            )
 
-        # Limit to 50 peers (typical tracker behavior)
-        if len(other_peers) > 50:
-            other_peers = random.sample(other_peers, 50)
+        # Return up to 50 other peers (typical tracker behavior). Small
+        # swarms just take the filtered list; large ones use a
+        # single-pass reservoir sample so we never materialize an O(N)
+        # candidate list only to throw most of it away.
+        if len(swarm) <= 51:
+            other_peers = [
+                p for peer_id, p in swarm.items() if peer_id != request.peer_id
+            ]
+        else:
+            other_peers = []
+            seen = 0
+            for peer_id, p in swarm.items():
+                if peer_id == request.peer_id:
+                    continue
+                if seen < 50:
+                    other_peers.append(p)
+                else:
+                    # Keep each later peer with probability 50/(seen+1)
+                    j = random.randint(0, seen)
+                    if j < 50:
+                        other_peers[j] = p
+                seen += 1
 
         response = TrackerResponse(
             interval=30,  # Re-announce every 30 seconds
@@ -75,8 +102,10 @@ class Tracker(Process):
 
         await request.response_queue.put(response)
 
-        print(
-            f"[{self.now:.1f}] Tracker: Sent {len(other_peers)} peers to "
-            f"{request.peer_id}"
+        logger.info(
+            "[%.1f] Tracker: Sent %d peers to %s",
+            self.now,
+            len(other_peers),
+            request.peer_id,
         )
     # mccole: /tracker_handle
@@ -1,5 +1,8 @@
 """Example using decorator-based tracing."""
 
+import logging
+import sys
+
 from asimpy import Environment, Process, Queue
 from trace_collector import TraceCollector
 from simple_service import SimpleService
@@ -33,7 +36,7 @@ class SimpleClient(Process):
         print(f"\n[{self.now:.1f}] {self.name}: Starting request {req_id}")
 
         # Create root span
-        root_span = Span(
+        root_span = Span.acquire(
             trace_id=trace_id,
             span_id=root_span_id,
             parent_span_id=None,
@@ -73,6 +76,7 @@ class SimpleClient(Process):
 # mccole: demo
 def main() -> None:
     """Demonstrate decorator-based tracing."""
+    logging.basicConfig(level=logging.INFO, format="%(message)s", stream=sys.stdout)
     env = Environment()
 
     # Create collector (quiet mode)
@@ -1,5 +1,8 @@
 """Example using JSON trace collector."""
 
+import logging
+import sys
+
 from asimpy import Environment, Process, Queue
 from json_collector import JSONTraceCollector
 from simple_service import SimpleService
@@ -47,6 +50,7 @@ class SimpleClient(Process):
 # mccole: demo
 def main() -> None:
     """Demonstrate JSON-formatted tracing output."""
+    logging.basicConfig(level=logging.INFO, format="%(message)s", stream=sys.stdout)
     env = Environment()
     collector = JSONTraceCollector(env)
     service = SimpleService(env, "OrderService", collector, verbose=False)
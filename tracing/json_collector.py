@@ -8,12 +8,13 @@ from tracing_types import BaseCollector, Span, Trace
 class JSONTraceCollector(BaseCollector):
     """Collects spans and outputs them as JSON."""
 
-    def init(self) -> None:
+    def init(self, max_active_traces: int = 1024) -> None:
         self.span_queue = Queue(self._env)
         self.active_traces: dict[str, Trace] = {}
-        self.completed_traces: list[Trace] = []
+        self.max_active_traces = max_active_traces
         self.spans_received = 0
         self.traces_completed = 0
+        self.traces_evicted = 0
 
     async def run(self) -> None:
         """Main collector loop."""
@@ -26,6 +27,14 @@ class JSONTraceCollector(BaseCollector):
         self.spans_received += 1
 
         if span.trace_id not in self.active_traces:
+            # Evict the oldest incomplete trace if the working set is
+            # full, recycling its spans (nothing else references them)
+            if len(self.active_traces) >= self.max_active_traces:
+                oldest_id = next(iter(self.active_traces))
+                evicted = self.active_traces.pop(oldest_id)
+                self.traces_evicted += 1
+                for old_span in evicted.spans_by_id.values():
+                    old_span.release()
             self.active_traces[span.trace_id] = Trace(trace_id=span.trace_id)
 
         trace = self.active_traces[span.trace_id]
@@ -36,16 +45,19 @@ class JSONTraceCollector(BaseCollector):
 
     def is_trace_complete(self, trace: Trace) -> bool:
         """Check if all spans in trace are finished."""
-        if not trace.spans:
-            return False
-        return all(span.end_time is not None for span in trace.spans)
+        return bool(trace.spans_by_id) and trace.unfinished == 0
 
     def complete_trace(self, trace: Trace) -> None:
-        """Mark trace as complete and output as JSON."""
-        self.completed_traces.append(trace)
+        """Output trace as JSON and recycle its spans.
+
+        The JSON text is the exporter's artifact, so the trace is not
+        retained afterwards and its spans go back to the free list.
+        """
         self.traces_completed += 1
         del self.active_traces[trace.trace_id]
         self.output_trace_json(trace)
+        for span in trace.spans_by_id.values():
+            span.release()
 
     def output_trace_json(self, trace: Trace) -> None:
         """Output trace in JSON format."""
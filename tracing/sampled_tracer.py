@@ -38,11 +38,14 @@ This module addresses two gaps in the basic tracing implementation:
    service name instead—but the principle is the same.
 """
 
+import logging
 import random
 from dataclasses import dataclass
 from asimpy import Process, Queue
 from tracing_types import TraceContext, Span, generate_id, BaseCollector
 
+logger = logging.getLogger(__name__)
+
 
 # mccole: sampler
 class HeadSampler:
@@ -83,7 +86,7 @@ class HeadSampler:
 
 
 # mccole: propagated_context
-@dataclass
+@dataclass(slots=True)
 class PropagatedRequest:
     """A request that carries trace context for cross-service propagation.
 
@@ -144,7 +147,7 @@ class SampledService(Process):
 
         span: Span | None = None
         if ctx is not None:
-            span = Span(
+            span = Span.acquire(
                 trace_id=ctx.trace_id,
                 span_id=generate_id("span_"),
                 parent_span_id=ctx.span_id,
@@ -180,10 +183,12 @@ class SampledService(Process):
             span.finish(self.now)
             await self.collector.span_queue.put(span)
             if child_ctx is not None:
-                print(
-                    f"[{self.now:.2f}] {self.service_name}: Recorded span "
-                    f"trace={ctx.trace_id[:8]}... "
-                    f"(sampled={self.sampler.rate:.0%})"
+                logger.info(
+                    "[%.2f] %s: Recorded span trace=%s... (sampled=%.0f%%)",
+                    self.now,
+                    self.service_name,
+                    ctx.trace_id_short,
+                    self.sampler.rate * 100,
                 )
 
         await req.response_queue.put({"ok": True})
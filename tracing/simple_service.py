@@ -1,15 +1,31 @@
 """Simple service instrumented with tracing decorators."""
 
+import logging
 import random
+from collections import deque
 from asimpy import Process, Queue
 from tracing_types import ServiceRequest, ServiceResponse
 from tracing_decorators import Storage, traced
 
+logger = logging.getLogger(__name__)
+
 
 # mccole: simple
 class SimpleService(Process):
     """Service instrumented with decorators."""
 
+    # Raw RNG draws precomputed in batches and shared across instances;
+    # each delay scales one draw, so most requests skip the generator
+    _delay_pool: deque = deque()
+    _POOL_BATCH = 256
+
+    @classmethod
+    def _next_delay(cls, low: float, high: float) -> float:
+        """Pop a precomputed draw and scale it into [low, high)."""
+        if not cls._delay_pool:
+            cls._delay_pool.extend(random.random() for _ in range(cls._POOL_BATCH))
+        return low + (high - low) * cls._delay_pool.popleft()
+
     def init(self, service_name: str, collector, verbose: bool = True):
         self.service_name = service_name
         self.collector = collector
@@ -20,7 +36,7 @@ class SimpleService(Process):
         Storage.set_collector(collector)
 
         if self.verbose:
-            print(f"[{self.now:.1f}] {self.service_name} started")
+            logger.info("[%.1f] %s started", self.now, self.service_name)
 
     async def run(self) -> None:
         """Handle incoming requests."""
@@ -32,13 +48,15 @@ class SimpleService(Process):
     async def handle_request(self, request: ServiceRequest) -> None:
         """Handle request - automatically traced."""
         if self.verbose:
-            print(f"[{self.now:.1f}] {self.service_name}: Processing {request}")
+            logger.info(
+                "[%.1f] %s: Processing %s", self.now, self.service_name, request
+            )
 
         # Set context for nested calls
         Storage.set_context(request.context)
 
         # Simulate processing
-        await self.timeout(random.uniform(0.1, 0.3))
+        await self.timeout(self._next_delay(0.1, 0.3))
 
         # Do some work
         data = await self.process_data(request.payload)
@@ -51,7 +69,7 @@ class SimpleService(Process):
     @traced("process_data")
     async def process_data(self, payload: dict) -> dict:
         """Process data - automatically traced as child span."""
-        await self.timeout(random.uniform(0.05, 0.15))
+        await self.timeout(self._next_delay(0.05, 0.15))
         return {"processed": True, "input": payload}
 
 
@@ -1,26 +1,34 @@
 """Trace collector for aggregating spans into traces."""
 
+import logging
 from asimpy import Queue
 from tracing_types import BaseCollector, Span, Trace
 
+logger = logging.getLogger(__name__)
+
 
 # mccole: collector
 class TraceCollector(BaseCollector):
     """Collects and aggregates spans into traces."""
 
-    def init(self, verbose=True) -> None:
+    def init(self, verbose=True, max_active_traces: int = 1024) -> None:
         self.verbose = verbose
         self.span_queue: Queue = Queue(self._env)
         self.active_traces: dict[str, Trace] = {}
         self.completed_traces: list[Trace] = []
 
+        # A trace whose spans never all arrive would otherwise sit in
+        # active_traces forever; cap the working set instead
+        self.max_active_traces = max_active_traces
+
         # Statistics
         self.spans_received = 0
         self.traces_completed = 0
+        self.traces_evicted = 0
 
     async def run(self) -> None:
         """Main collector loop."""
-        print(f"[{self.now:.1f}] TraceCollector started")
+        logger.info("[%.1f] TraceCollector started", self.now)
         while True:
             span = await self.span_queue.get()
             self.process_span(span)
@@ -32,8 +40,13 @@ class TraceCollector(BaseCollector):
         """Process incoming span."""
         self.spans_received += 1
 
-        # Get or create trace
+        # Get or create trace, evicting the oldest incomplete trace if
+        # the working set is full (dicts preserve insertion order)
         if span.trace_id not in self.active_traces:
+            if len(self.active_traces) >= self.max_active_traces:
+                oldest_id = next(iter(self.active_traces))
+                del self.active_traces[oldest_id]
+                self.traces_evicted += 1
             self.active_traces[span.trace_id] = Trace(trace_id=span.trace_id)
 
         trace = self.active_traces[span.trace_id]
@@ -48,9 +61,9 @@ class TraceCollector(BaseCollector):
 
     def is_trace_complete(self, trace: Trace) -> bool:
         """Check if all spans in trace are finished."""
-        if not trace.spans:
-            return False
-        return all(span.end_time is not None for span in trace.spans)
+        # The trace counts unfinished spans as they arrive, so this is
+        # one comparison rather than a scan over every span
+        return bool(trace.spans_by_id) and trace.unfinished == 0
 
     def complete_trace(self, trace: Trace) -> None:
         """Mark trace as complete and move to storage."""
@@ -58,33 +71,46 @@ class TraceCollector(BaseCollector):
         self.traces_completed += 1
         del self.active_traces[trace.trace_id]
 
+        # Order each parent's children by start time once, here, so
+        # printing the tree never re-sorts at every node
+        spans_by_id = trace.spans_by_id
+        for child_ids in trace.children_by_parent.values():
+            child_ids.sort(key=lambda child_id: spans_by_id[child_id].start_time)
+
     # mccole: /process
 
     def report_trace(self, trace: Trace) -> None:
         """Show newly-completed trace."""
 
         duration = trace.get_duration()
-        print(f"\n[{self.now:.1f}] Completed {trace}")
-        print(
-            f"  Total duration: {duration:.3f}s" if duration else "  Duration: unknown"
-        )
-        print(f"  Spans: {len(trace.spans)}")
+        logger.info("\n[%.1f] Completed %s", self.now, trace)
+        if duration:
+            logger.info("  Total duration: %.3fs", duration)
+        else:
+            logger.info("  Duration: unknown")
+        logger.info("  Spans: %d", len(trace.spans_by_id))
 
     def print_span_tree(self, trace: Trace) -> None:
         """Print span tree structure."""
         root = trace.get_root_span()
         if root:
-            print("  Span tree:")
+            logger.info("  Span tree:")
             self._print_span_recursive(trace, root, indent=2)
 
     def _print_span_recursive(self, trace: Trace, span: Span, indent: int) -> None:
         """Recursively print span and children."""
         prefix = " " * indent + "└─"
         duration_str = f"{span.duration:.3f}s" if span.duration else "?"
-        print(f"{prefix} {span.operation_name} ({span.service_name}) - {duration_str}")
+        logger.info(
+            "%s %s (%s) - %s",
+            prefix,
+            span.operation_name,
+            span.service_name,
+            duration_str,
+        )
 
-        children = [s for s in trace.spans if s.parent_span_id == span.span_id]
-        for child in sorted(children, key=lambda s: s.start_time):
+        # Children were sorted by start time when the trace completed
+        for child in trace.get_children(span.span_id):
             self._print_span_recursive(trace, child, indent + 2)
 
     def get_slow_traces(self, threshold: float) -> list[Trace]:
@@ -55,8 +55,8 @@ def traced(operation_name: str):
             # Get service name from class
             service_name = getattr(self, "service_name", self.__class__.__name__)
 
-            # Create span
-            span = Span(
+            # Create span (recycled from the free list when possible)
+            span = Span.acquire(
                 trace_id=context.trace_id,
                 span_id=generate_id("span_"),
                 parent_span_id=context.span_id,
@@ -84,7 +84,7 @@ def traced(operation_name: str):
                 # Record error
                 span.add_tag("error", True)
                 span.add_tag("error.message", str(e))
-                span.add_log("exception", exception=str(e))
+                span.add_log("exception", timestamp=self.now, exception=str(e))
                 raise
 
             finally:
@@ -143,8 +143,8 @@ def trace_root(operation_name: str | None = None):
             trace_id = generate_id("trace_")
             root_span_id = generate_id("span_")
 
-            # Create root span
-            root_span = Span(
+            # Create root span (recycled from the free list when possible)
+            root_span = Span.acquire(
                 trace_id=trace_id,
                 span_id=root_span_id,
                 parent_span_id=None,
@@ -1,6 +1,6 @@
 """Data types for distributed tracing implementation."""
 
-from asimpy import Environment
+from collections import defaultdict
 from dataclasses import dataclass, field
 import random
 from typing import Any
@@ -12,7 +12,7 @@ class BaseCollector(Process):
 
 
 # mccole: context
-@dataclass
+@dataclass(slots=True)
 class TraceContext:
     """Context propagated between services."""
 
@@ -22,12 +22,27 @@ class TraceContext:
     baggage: dict[str, str] = field(default_factory=dict)
     # mccole: /context
 
+    # Short forms sliced once here rather than on every log line
+    trace_id_short: str = field(init=False, repr=False, compare=False)
+    span_id_short: str = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        self.trace_id_short = self.trace_id[:8]
+        self.span_id_short = self.span_id[:8]
+
     def __str__(self) -> str:
-        return f"TraceContext(trace={self.trace_id[:8]}..., span={self.span_id[:8]}...)"
+        return (
+            f"TraceContext(trace={self.trace_id_short}..., "
+            f"span={self.span_id_short}...)"
+        )
+
+
+# Free list of released spans awaiting reuse (see Span.acquire)
+_span_pool: list["Span"] = []
 
 
 # mccole: span
-@dataclass
+@dataclass(slots=True)
 class Span:
     """Represents a unit of work in a trace."""
 
@@ -41,21 +56,33 @@ class Span:
     duration: float | None = None
     tags: dict[str, Any] = field(default_factory=dict)
     logs: list[dict[str, Any]] = field(default_factory=list)
+    # Owning trace, set when a collector adds the span; lets finish()
+    # update the trace's bookkeeping without a scan
+    trace: "Trace | None" = field(default=None, repr=False, compare=False)
 
     def add_tag(self, key: str, value: Any) -> None:
         """Add metadata tag to span."""
         self.tags[key] = value
 
-    def add_log(self, message: str, **fields: Any) -> None:
-        """Add log entry to span."""
-        self.logs.append(
-            {"message": message, "timestamp": Environment.sim_time(), **fields}
-        )
+    def add_log(
+        self, message: str, timestamp: float | None = None, **fields: Any
+    ) -> None:
+        """Add log entry to span, stamped with the caller's sim time.
+
+        Spans live on the simulated clock, so the caller supplies the
+        time (usually its own self.now); without one, the entry is
+        stamped with the span's start time.
+        """
+        if timestamp is None:
+            timestamp = self.start_time
+        self.logs.append({"message": message, "timestamp": timestamp, **fields})
 
     def finish(self, end_time: float) -> None:
         """Mark span as complete."""
         self.end_time = end_time
         self.duration = end_time - self.start_time
+        if self.trace is not None:
+            self.trace.on_span_finished(end_time)
 
     # mccole: /span
 
@@ -63,20 +90,89 @@ class Span:
         status = f"{self.duration:.3f}s" if self.duration else "active"
         return f"Span({self.operation_name}, {status})"
 
+    @classmethod
+    def acquire(
+        cls,
+        trace_id: str,
+        span_id: str,
+        parent_span_id: str | None,
+        operation_name: str,
+        service_name: str,
+        start_time: float,
+    ) -> "Span":
+        """Take a span from the free list, or allocate a fresh one.
+
+        Every traced operation costs a Span plus its tags dict and logs
+        list; recycling released instances reuses all three. Only
+        release a span once its trace has been exported and dropped.
+        """
+        if _span_pool:
+            span = _span_pool.pop()
+            span.trace_id = trace_id
+            span.span_id = span_id
+            span.parent_span_id = parent_span_id
+            span.operation_name = operation_name
+            span.service_name = service_name
+            span.start_time = start_time
+            span.end_time = None
+            span.duration = None
+            span.trace = None
+            span.tags.clear()
+            span.logs.clear()
+            return span
+        return cls(
+            trace_id=trace_id,
+            span_id=span_id,
+            parent_span_id=parent_span_id,
+            operation_name=operation_name,
+            service_name=service_name,
+            start_time=start_time,
+        )
+
+    def release(self) -> None:
+        """Return this span to the free list for reuse."""
+        _span_pool.append(self)
+
 
 # mccole: trace
-@dataclass
+@dataclass(slots=True)
 class Trace:
-    """Complete trace containing all spans."""
+    """Complete trace containing all spans.
+
+    Spans are indexed by ID and by parent, so finding the root, a
+    span's children, or whether any span is still running are all
+    direct lookups rather than scans over the whole trace.
+    """
 
     trace_id: str
-    spans: list[Span] = field(default_factory=list)
+    spans_by_id: dict[str, Span] = field(default_factory=dict)
+    children_by_parent: dict[str | None, list[str]] = field(
+        default_factory=lambda: defaultdict(list)
+    )
+    unfinished: int = 0
+    root: Span | None = None
     start_time: float | None = None
     end_time: float | None = None
+    # Short form sliced once here rather than on every log line
+    trace_id_short: str = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        self.trace_id_short = self.trace_id[:8]
+
+    @property
+    def spans(self) -> list[Span]:
+        """All spans in arrival order."""
+        return list(self.spans_by_id.values())
 
     def add_span(self, span: Span) -> None:
         """Add span to trace."""
-        self.spans.append(span)
+        self.spans_by_id[span.span_id] = span
+        self.children_by_parent[span.parent_span_id].append(span.span_id)
+        span.trace = self
+        if span.parent_span_id is None and self.root is None:
+            self.root = span
+        if span.end_time is None:
+            self.unfinished += 1
 
         if self.start_time is None or span.start_time < self.start_time:
             self.start_time = span.start_time
@@ -85,12 +181,24 @@ class Trace:
             if self.end_time is None or span.end_time > self.end_time:
                 self.end_time = span.end_time
 
+    def on_span_finished(self, end_time: float) -> None:
+        """Record that a tracked span has finished (see Span.finish).
+
+        Keeping the count current as spans finish means completeness
+        never requires rescanning the whole trace.
+        """
+        self.unfinished -= 1
+        if self.end_time is None or end_time > self.end_time:
+            self.end_time = end_time
+
     def get_root_span(self) -> Span | None:
-        """Get root span (no parent)."""
-        for span in self.spans:
-            if span.parent_span_id is None:
-                return span
-        return None
+        """Get root span (no parent), cached as spans arrive."""
+        return self.root
+
+    def get_children(self, span_id: str) -> list[Span]:
+        """Get the spans whose parent is the given span."""
+        child_ids = self.children_by_parent.get(span_id, ())
+        return [self.spans_by_id[child_id] for child_id in child_ids]
 
     def get_duration(self) -> float | None:
         """Get total trace duration."""
@@ -103,10 +211,12 @@ class Trace:
     def __str__(self) -> str:
         duration = self.get_duration()
         status = f"{duration:.3f}s" if duration else "incomplete"
-        return f"Trace({self.trace_id[:8]}..., {len(self.spans)} spans, {status})"
+        return (
+            f"Trace({self.trace_id_short}..., {len(self.spans_by_id)} spans, {status})"
+        )
 
 
-@dataclass
+@dataclass(slots=True)
 class ServiceRequest:
     """Request between services with trace context."""
 
@@ -119,7 +229,7 @@ class ServiceRequest:
         return f"Request({self.request_id})"
 
 
-@dataclass
+@dataclass(slots=True)
 class ServiceResponse:
     """Response from service."""
 
@@ -133,6 +243,16 @@ class ServiceResponse:
         return f"Response({self.request_id}, {status})"
 
 
+# Bound once so the hot ID path skips the module-attribute lookup
+_getrandbits = random.getrandbits
+
+
 def generate_id(prefix: str = "") -> str:
-    """Generate unique ID for trace or span."""
-    return f"{prefix}{random.randint(1000000, 9999999)}"
+    """Generate unique ID for trace or span.
+
+    getrandbits is the cheapest draw the RNG offers (randint layers
+    range arithmetic on top of it), and %x formatting turns it straight
+    into hex. Real tracers use os.urandom so IDs are unguessable; the
+    simulation stays on the seeded generator so runs are reproducible.
+    """
+    return prefix + "%08x" % _getrandbits(32)
@@ -1,5 +1,6 @@
 """Scheduler with adaptive workers."""
 
+from array import array
 from asimpy import Environment
 from typing import List
 from scheduler import WorkStealingScheduler
@@ -14,6 +15,9 @@ class AdaptiveScheduler(WorkStealingScheduler):
         self.num_workers = num_workers
         self.workers: List[AdaptiveWorker] = []
         self.task_counter = 0
+        self.queue_sizes = array("i", [0] * num_workers)
+        self.busy_workers = 0
+        self.idle_workers: dict = {}
 
         for i in range(num_workers):
             worker = AdaptiveWorker(env, i, self)
@@ -1,5 +1,6 @@
 """Worker with adaptive target selection strategy."""
 
+import logging
 from typing import TYPE_CHECKING
 from worker import Worker
 from task import Task
@@ -7,15 +8,21 @@ from task import Task
 if TYPE_CHECKING:
     from scheduler import WorkStealingScheduler
 
+logger = logging.getLogger(__name__)
+
 
 # mccole: worker
 class AdaptiveWorker(Worker):
     """Worker with adaptive target selection."""
 
     def init(
-        self, worker_id: int, scheduler: "WorkStealingScheduler", verbose: bool = True
+        self,
+        worker_id: int,
+        scheduler: "WorkStealingScheduler",
+        verbose: bool = True,
+        cpu_id: int | None = None,
     ):
-        super().init(worker_id, scheduler)
+        super().init(worker_id, scheduler, cpu_id=cpu_id)
         self.steal_attempts = 0
         self.failed_steals = 0
 
@@ -23,21 +30,33 @@ class AdaptiveWorker(Worker):
         """Try to steal with adaptive target selection."""
         self.steal_attempts += 1
 
-        # Try workers with largest queues first
-        targets = [w for w in self.scheduler.workers if w != self]
-        targets.sort(key=lambda w: w.deque.size(), reverse=True)
-
-        for target in targets:
-            if target.deque.size() > 0:
-                task = target.deque.steal_top()
-                if task:
-                    self.tasks_stolen += 1
-                    print(
-                        f"[{self.now:.1f}] Worker {self.worker_id}: "
-                        f"Stole {task.task_id} from Worker {target.worker_id} "
-                        f"(target queue: {target.deque.size()})"
-                    )
-                    return task
+        # Only the victim with the deepest queue can yield a task, so a
+        # single pass for the maximum replaces sorting every candidate;
+        # ties go to the lower-numbered worker, as the sort did. The
+        # scheduler's flat size array makes the pass a scan over ints
+        # rather than a method call per victim.
+        own_id = self.worker_id
+        best_id = -1
+        best_size = 0
+        for worker_id, size in enumerate(self.scheduler.queue_sizes):
+            if worker_id != own_id and size > best_size:
+                best_size = size
+                best_id = worker_id
+
+        if best_id >= 0:
+            best = self.scheduler.workers[best_id]
+            task = best.deque.steal_top()
+            if task:
+                self.tasks_stolen += 1
+                logger.info(
+                    "[%.1f] Worker %d: Stole %s from Worker %d (target queue: %d)",
+                    self.now,
+                    self.worker_id,
+                    task.task_id,
+                    best.worker_id,
+                    best.deque.size(),
+                )
+                return task
 
         self.failed_steals += 1
         return None
@@ -1,6 +1,8 @@
 """Simulation with adaptive stealing strategy."""
 
+import logging
 import random
+import sys
 from asimpy import Environment
 from adaptive_scheduler import AdaptiveScheduler
 from task import Task
@@ -9,6 +11,7 @@ from dsdx import dsdx
 
 def main():
     """Demonstrate adaptive stealing strategy."""
+    logging.basicConfig(level=logging.INFO, format="%(message)s", stream=sys.stdout)
     env = Environment()
 
     scheduler = AdaptiveScheduler(env, num_workers=4)
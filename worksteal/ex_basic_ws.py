@@ -1,6 +1,8 @@
 """Basic work-stealing simulation."""
 
+import logging
 import random
+import sys
 from asimpy import Environment
 from scheduler import WorkStealingScheduler
 from dsdx import dsdx
@@ -9,6 +11,7 @@ from dsdx import dsdx
 # mccole: sim
 def main():
     """Basic work-stealing simulation."""
+    logging.basicConfig(level=logging.INFO, format="%(message)s", stream=sys.stdout)
     env = Environment()
 
     scheduler = WorkStealingScheduler(env, num_workers=3)
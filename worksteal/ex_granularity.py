@@ -1,5 +1,8 @@
 """Experiment with different task granularities."""
 
+import logging
+import sys
+
 from asimpy import Environment
 from scheduler import WorkStealingScheduler
 from performance_analyzer import PerformanceAnalyzer
@@ -8,6 +11,7 @@ from dsdx import dsdx
 
 def main():
     """Experiment with different task granularities."""
+    logging.basicConfig(level=logging.INFO, format="%(message)s", stream=sys.stdout)
     for granularity in [0.1, 0.5, 2.0]:
         env = Environment()
         scheduler = WorkStealingScheduler(env, num_workers=4, verbose=False)
@@ -1,5 +1,8 @@
 """Simulation with nested task spawning."""
 
+import logging
+import sys
+
 from asimpy import Environment
 from scheduler_with_spawning import SchedulerWithSpawning
 from task_generator import TaskGenerator
@@ -9,6 +12,7 @@ from dsdx import dsdx
 # mccole: sim
 def main():
     """Demonstrate nested task spawning."""
+    logging.basicConfig(level=logging.INFO, format="%(message)s", stream=sys.stdout)
     env = Environment()
 
     # Create scheduler with spawning workers
@@ -1,11 +1,13 @@
 """Worker that waits for child tasks to complete before finishing the parent."""
 
-import random
+import logging
 from typing import Dict
 from asimpy import Queue
 from task import Task
 from worker import Worker
 
+logger = logging.getLogger(__name__)
+
 
 # mccole: joining
 class JoiningWorker(Worker):
@@ -29,8 +31,14 @@ class JoiningWorker(Worker):
     be atomic to avoid the parent waking up before all children are done.
     """
 
-    def init(self, worker_id: int, scheduler, verbose: bool = True):
-        super().init(worker_id, scheduler, verbose)
+    def init(
+        self,
+        worker_id: int,
+        scheduler,
+        verbose: bool = True,
+        cpu_id: int | None = None,
+    ):
+        super().init(worker_id, scheduler, verbose, cpu_id)
         # Maps parent_id -> Queue that the parent is waiting on.
         # Each child posts to this queue when it completes.
         self.join_queues: Dict[str, Queue] = {}
@@ -43,9 +51,8 @@ class JoiningWorker(Worker):
         self.tasks_executed += 1
 
         if self.verbose:
-            print(
-                f"[{self.now:.1f}] Worker {self.worker_id}: "
-                f"Executing {task.task_id}"
+            logger.info(
+                "[%.1f] Worker %d: Executing %s", self.now, self.worker_id, task.task_id
             )
 
         # Do the first half of the work.
@@ -53,25 +60,29 @@ class JoiningWorker(Worker):
 
         # Randomly spawn children (simulating divide-and-conquer).
         children_spawned: int = 0
-        if random.random() < 0.4:
-            num_children = random.randint(1, 3)
+        if self.rng.random() < 0.4:
+            num_children = self.rng.randint(1, 3)
             # Create a queue that children will signal when they are done.
             join_queue: Queue = Queue(self._env)
             self.join_queues[task.task_id] = join_queue
             self.pending_children[task.task_id] = num_children
 
+            prefix = task.task_id + "."
             for i in range(num_children):
-                child = Task(
-                    task_id=f"{task.task_id}.{i}",
-                    duration=random.uniform(0.3, 0.8),
+                child = Task.acquire(
+                    task_id=prefix + str(i),
+                    duration=self.rng.uniform(0.3, 0.8),
                     parent_id=task.task_id,
                 )
                 self.deque.push_bottom(child)
+                self.scheduler.wake_idle_worker()
                 children_spawned += 1
                 if self.verbose:
-                    print(
-                        f"[{self.now:.1f}] Worker {self.worker_id}: "
-                        f"Spawned child {child.task_id}"
+                    logger.info(
+                        "[%.1f] Worker %d: Spawned child %s",
+                        self.now,
+                        self.worker_id,
+                        child.task_id,
                     )
 
         # If children were spawned, wait until all of them complete.
@@ -85,18 +96,19 @@ class JoiningWorker(Worker):
             del self.pending_children[task.task_id]
 
             if self.verbose:
-                print(
-                    f"[{self.now:.1f}] Worker {self.worker_id}: "
-                    f"All children of {task.task_id} done; resuming parent"
+                logger.info(
+                    "[%.1f] Worker %d: All children of %s done; resuming parent",
+                    self.now,
+                    self.worker_id,
+                    task.task_id,
                 )
 
         # Do the second half of the work.
         await self.timeout(task.duration / 2)
 
         if self.verbose:
-            print(
-                f"[{self.now:.1f}] Worker {self.worker_id}: "
-                f"Completed {task.task_id}"
+            logger.info(
+                "[%.1f] Worker %d: Completed %s", self.now, self.worker_id, task.task_id
             )
 
         self.current_task = None
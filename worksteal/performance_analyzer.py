@@ -27,14 +27,13 @@ class PerformanceAnalyzer(Process):
         for i in range(num_tasks):
             self.scheduler.submit_task(self.task_granularity)
 
-        # Wait for all workers to become idle
+        # Wait for all workers to become idle: nobody executing and no
+        # queued tasks. Both reads are scheduler-level bookkeeping, so
+        # the poll never walks the worker list.
+        scheduler = self.scheduler
         while True:
             await self.timeout(1.0)
-            all_idle = all(
-                w.deque.is_empty() and w.current_task is None
-                for w in self.scheduler.workers
-            )
-            if all_idle:
+            if scheduler.busy_workers == 0 and not any(scheduler.queue_sizes):
                 self.end_time = self.now
                 break
 
@@ -1,10 +1,14 @@
 """Work-stealing scheduler coordinator."""
 
-import random
+import logging
+import os
+from array import array
 from asimpy import Environment
 from task import Task
 from worker import Worker
 
+logger = logging.getLogger(__name__)
+
 
 # mccole: scheduler
 class WorkStealingScheduler:
@@ -22,32 +26,59 @@ class WorkStealingScheduler:
         self.verbose = verbose
         self.workers: list = []
         self.task_counter = 0
+        self._next_worker = 0  # Round-robin submission cursor
+        self.busy_workers = 0  # Workers currently executing a task
+        self.idle_workers: dict = {}  # Parked workers awaiting a wake-up
+
+        # One flat array of queue depths, kept current by the deques,
+        # so victim selection scans counts instead of calling methods
+        self.queue_sizes = array("i", [0] * num_workers)
 
-        # Create workers
+        # Create workers, spreading them across CPUs so a thread
+        # backend can pin each one (the simulation ignores cpu_id)
+        cpu_count = os.cpu_count() or 1
         for i in range(num_workers):
-            worker = worker_cls(env, i, self, verbose)
+            worker = worker_cls(env, i, self, verbose, cpu_id=i % cpu_count)
             self.workers.append(worker)
 
     def submit_task(self, duration: float, parent_id: str | None = None) -> Task:
-        """Submit a task to a random worker."""
+        """Submit a task to the next worker in round-robin order."""
         self.task_counter += 1
-        task = Task(
+        task = Task.acquire(
             task_id=f"T{self.task_counter}",
             duration=duration,
             parent_id=parent_id,
         )
 
-        worker = random.choice(self.workers)
+        # Cycling through the workers skips the RNG call entirely and
+        # spreads initial placement evenly; imbalance from uneven task
+        # durations is what stealing is for
+        worker = self.workers[self._next_worker]
+        self._next_worker = (self._next_worker + 1) % self.num_workers
         worker.deque.push_bottom(task)
+        self.wake_idle_worker()
 
         if self.verbose:
-            print(
-                f"[{self.env.now:.1f}] Submitted {task.task_id} "
-                f"to Worker {worker.worker_id}"
+            logger.info(
+                "[%.1f] Submitted %s to Worker %d",
+                self.env.now,
+                task.task_id,
+                worker.worker_id,
             )
 
         return task
 
+    def wake_idle_worker(self):
+        """Wake one parked worker to claim newly available work.
+
+        Submitting and spawning notify exactly one waiter, so wake-ups
+        scale with tasks rather than with idle time; a woken worker
+        whose task was stolen in the meantime simply parks again.
+        """
+        if self.idle_workers:
+            _, worker = self.idle_workers.popitem()
+            worker.wake_event.succeed()
+
     # mccole: /scheduler
 
     def get_statistics(self):
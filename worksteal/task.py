@@ -2,11 +2,18 @@
 
 from dataclasses import dataclass
 
+# Free list of completed tasks awaiting reuse (see Task.acquire)
+_task_pool: list["Task"] = []
+
 
 # mccole: task
-@dataclass
+@dataclass(slots=True)
 class Task:
-    """A unit of work to be executed."""
+    """A unit of work to be executed.
+
+    Spawning workloads create tasks by the thousand, so instances are
+    slotted: no per-task __dict__, less memory, faster field access.
+    """
 
     task_id: str
     duration: float
@@ -15,5 +22,25 @@ class Task:
     def __str__(self):
         return f"Task({self.task_id})"
 
+    @classmethod
+    def acquire(cls, task_id: str, duration: float, parent_id: str | None = None):
+        """Take a task from the free list, or allocate a fresh one.
+
+        Spawning workloads churn through short-lived tasks; recycling
+        completed instances takes the allocator out of the loop. Only
+        release a task once nothing holds a reference to it.
+        """
+        if _task_pool:
+            task = _task_pool.pop()
+            task.task_id = task_id
+            task.duration = duration
+            task.parent_id = parent_id
+            return task
+        return cls(task_id, duration, parent_id)
+
+    def release(self):
+        """Return this task to the free list for reuse."""
+        _task_pool.append(self)
+
 
 # mccole: /task
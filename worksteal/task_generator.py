@@ -12,11 +12,17 @@ class TaskGenerator(Process):
     def init(self, scheduler: WorkStealingScheduler, num_initial_tasks: int):
         self.scheduler = scheduler
         self.num_initial_tasks = num_initial_tasks
+        self.rng = random.Random(random.getrandbits(32))
+        # Draw every duration in one batch up front; the generator's
+        # loop then just walks a list instead of calling the RNG
+        self._durations = [
+            self.rng.uniform(1.0, 3.0) for _ in range(num_initial_tasks)
+        ]
 
     async def run(self):
         """Generate initial tasks."""
-        for i in range(self.num_initial_tasks):
-            self.scheduler.submit_task(duration=random.uniform(1.0, 3.0))
+        for duration in self._durations:
+            self.scheduler.submit_task(duration=duration)
             await self.timeout(0.5)
 
 
@@ -1,30 +1,60 @@
 """Worker process for work-stealing scheduler."""
 
+import logging
+import os
 import random
 from typing import TYPE_CHECKING
-from asimpy import Process
+from asimpy import Event, FirstOf, Process, Timeout
 from task import Task
 from worker_deque import WorkerDeque
 
 if TYPE_CHECKING:
     from scheduler import WorkStealingScheduler
 
+logger = logging.getLogger(__name__)
+
 
 # mccole: worker
 class Worker(Process):
     """Worker that executes tasks with work-stealing."""
 
     def init(
-        self, worker_id: int, scheduler: "WorkStealingScheduler", verbose: bool = True
+        self,
+        worker_id: int,
+        scheduler: "WorkStealingScheduler",
+        verbose: bool = True,
+        cpu_id: int | None = None,
     ):
         self.worker_id = worker_id
         self.scheduler = scheduler
         self.verbose = verbose
-        self.deque = WorkerDeque()
+        self.cpu_id = cpu_id
+        self.deque = WorkerDeque(scheduler.queue_sizes, worker_id)
+        # Workers get private generators (seeded from the global stream
+        # so runs stay reproducible): under real threads a shared RNG
+        # serializes behind its lock, and even here it skips the module
+        # lookup on every draw
+        self.rng = random.Random(random.getrandbits(32))
+        self._sizes = scheduler.queue_sizes  # Hoisted off the steal path
+        self._peers: tuple["Worker", ...] | None = None
+        self.wake_event: Event | None = None
+        self._backoff = 0.1  # Current idle nap, doubled while starved
         self.current_task: Task | None = None
         self.tasks_executed = 0
         self.tasks_stolen = 0
 
+    def _pin(self):
+        """Pin the hosting OS thread to this worker's CPU.
+
+        Only meaningful once workers run on real threads: a thread that
+        stays on one core keeps its deque hot in that core's cache and
+        avoids paying cross-socket latency when it is robbed. The
+        simulation itself never calls this; a thread backend would do
+        so in each thread's entry function.
+        """
+        if self.cpu_id is not None and hasattr(os, "sched_setaffinity"):
+            os.sched_setaffinity(0, {self.cpu_id})
+
     # mccole: /worker
 
     # mccole: run
@@ -34,17 +64,40 @@ class Worker(Process):
             # Try to get a task from local deque
             task = self.deque.pop_bottom()
 
+            if task is None:
+                # No local work, try stealing
+                task = await self.try_steal()
+
             if task:
-                # Execute local task
+                self._backoff = 0.1
+                # The scheduler's busy count lets observers test for an
+                # idle pool without polling every worker
+                self.scheduler.busy_workers += 1
                 await self.execute_task(task)
+                self.scheduler.busy_workers -= 1
+                # Nothing references a finished task, so recycle it
+                task.release()
             else:
-                # No local work, try stealing
-                stolen = await self.try_steal()
-                if stolen:
-                    await self.execute_task(stolen)
+                # No task found: park until the scheduler signals a new
+                # one instead of polling on a timer. The timeout is a
+                # safety net in case a wake-up is missed (e.g. the
+                # signalled task is stolen first). If work is visible
+                # and the probes just missed it, retry promptly; in a
+                # real drought the nap doubles so long-idle workers
+                # sleep rather than spin
+                if any(self._sizes):
+                    nap = 0.1
                 else:
-                    # No work available anywhere, wait a bit
-                    await self.timeout(0.1)
+                    nap = self._backoff
+                    self._backoff = min(self._backoff * 2, 1.6)
+                self.wake_event = Event(self._env)
+                self.scheduler.idle_workers[self.worker_id] = self
+                await FirstOf(
+                    self._env,
+                    wake=self.wake_event,
+                    nap=Timeout(self._env, nap),
+                )
+                self.scheduler.idle_workers.pop(self.worker_id, None)
 
     # mccole: /run
 
@@ -54,15 +107,20 @@ class Worker(Process):
         self.current_task = task
         self.tasks_executed += 1
         if self.verbose:
-            print(
-                f"[{self.now:.1f}] Worker {self.worker_id}: "
-                f"Executing {task.task_id} (queue size: {self.deque.size()})"
+            logger.info(
+                "[%.1f] Worker %d: Executing %s (queue size: %d)",
+                self.now,
+                self.worker_id,
+                task.task_id,
+                self.deque.size(),
             )
 
         await self.timeout(task.duration)
 
         if self.verbose:
-            print(f"[{self.now:.1f}] Worker {self.worker_id}: Completed {task.task_id}")
+            logger.info(
+                "[%.1f] Worker %d: Completed %s", self.now, self.worker_id, task.task_id
+            )
         self.current_task = None
 
     # mccole: /execute
@@ -70,22 +128,61 @@ class Worker(Process):
     # mccole: steal
     async def try_steal(self) -> Task | None:
         """Try to steal a task from another worker."""
-        targets = [w for w in self.scheduler.workers if w != self]
-        if not targets:
+        # The pool is fixed once the scheduler has built it, so filter
+        # out ourselves once instead of on every starved poll; building
+        # lazily catches workers created after this one
+        if self._peers is None:
+            self._peers = tuple(w for w in self.scheduler.workers if w is not self)
+        peers = self._peers
+        if not peers:
             return None
 
-        random.shuffle(targets)
+        # The shared size array makes "anything to take?" one scan of
+        # ints; when the whole pool is drained a starved worker learns
+        # that without probing (or touching the RNG) at all
+        sizes = self._sizes
+        if not any(sizes):
+            return None
 
-        for target in targets:
-            task = target.deque.steal_top()
-            if task:
-                self.tasks_stolen += 1
+        # Probe a handful of random victims instead of shuffling and
+        # scanning all of them: when everyone is idle an exhaustive scan
+        # is O(n) of wasted work, while log2(n) probes almost always
+        # find a busy victim when one exists. Loop lookups are bound
+        # once - this poll runs on every starved wake-up
+        randrange = self.rng.randrange
+        num_peers = len(peers)
+        probes = max(1, num_peers.bit_length())
+        for _ in range(probes):
+            target = peers[randrange(num_peers)]
+            size = sizes[target.worker_id]
+            if size == 0:
+                continue
+            # Take half the victim's queue in one raid: the extra tasks
+            # keep this worker busy without further probing, and
+            # halving is a classic way to even out the load
+            batch = target.deque.steal_top_batch(max(1, size // 2))
+            if batch:
+                self.tasks_stolen += len(batch)
+                if len(batch) > 1:
+                    self.deque.push_bottom_many(batch[1:])
                 if self.verbose:
-                    print(
-                        f"[{self.now:.1f}] Worker {self.worker_id}: "
-                        f"Stole {task.task_id} from Worker {target.worker_id}"
-                    )
-                return task
+                    if len(batch) == 1:
+                        logger.info(
+                            "[%.1f] Worker %d: Stole %s from Worker %d",
+                            self.now,
+                            self.worker_id,
+                            batch[0].task_id,
+                            target.worker_id,
+                        )
+                    else:
+                        logger.info(
+                            "[%.1f] Worker %d: Stole %d tasks from Worker %d",
+                            self.now,
+                            self.worker_id,
+                            len(batch),
+                            target.worker_id,
+                        )
+                return batch[0]
 
         return None
 
@@ -1,26 +1,67 @@
 """Double-ended queue for work-stealing."""
 
+from array import array
+from collections import deque
 from task import Task
 
 
 # mccole: deque
 class WorkerDeque:
-    """Double-ended queue for tasks with stealing support."""
+    """Double-ended queue for tasks with stealing support.
 
-    def __init__(self):
-        self.tasks: list[Task] = []
+    The owner pushes and pops at one end while thieves take from the
+    other, so both ends must be cheap; collections.deque makes each
+    operation O(1), where a list would shift every element on pop(0).
+
+    A deque can be given a slot in a shared size array that it keeps
+    current on every mutation; thieves then scan one flat array of
+    counts instead of calling size() on every victim.
+    """
+
+    def __init__(self, sizes: array | None = None, index: int = 0):
+        self.tasks: deque[Task] = deque()
+        self._sizes = sizes
+        self._index = index
 
     def push_bottom(self, task: Task):
         """Owner pushes task to bottom (private end)."""
         self.tasks.append(task)
+        if self._sizes is not None:
+            self._sizes[self._index] = len(self.tasks)
+
+    def push_bottom_many(self, tasks: list[Task]):
+        """Owner pushes a batch of tasks with a single extend."""
+        self.tasks.extend(tasks)
+        if self._sizes is not None:
+            self._sizes[self._index] = len(self.tasks)
 
     def pop_bottom(self) -> Task | None:
         """Owner pops task from bottom."""
-        return self.tasks.pop() if self.tasks else None
+        if not self.tasks:
+            return None
+        task = self.tasks.pop()
+        if self._sizes is not None:
+            self._sizes[self._index] = len(self.tasks)
+        return task
 
     def steal_top(self) -> Task | None:
         """Thief steals task from top (public end)."""
-        return self.tasks.pop(0) if self.tasks else None
+        if not self.tasks:
+            return None
+        task = self.tasks.popleft()
+        if self._sizes is not None:
+            self._sizes[self._index] = len(self.tasks)
+        return task
+
+    def steal_top_batch(self, want: int) -> list[Task]:
+        """Thief steals up to want tasks from the top in one raid."""
+        tasks = self.tasks
+        batch = []
+        while tasks and len(batch) < want:
+            batch.append(tasks.popleft())
+        if self._sizes is not None:
+            self._sizes[self._index] = len(tasks)
+        return batch
 
     def is_empty(self) -> bool:
         """Check if deque is empty."""
@@ -1,9 +1,11 @@
 """Worker that can spawn child tasks during execution."""
 
-import random
+import logging
 from worker import Worker
 from task import Task
 
+logger = logging.getLogger(__name__)
+
 
 # mccole: spawner
 class WorkerWithSpawning(Worker):
@@ -14,33 +16,50 @@ class WorkerWithSpawning(Worker):
         self.current_task = task
         self.tasks_executed += 1
 
-        print(f"[{self.now:.1f}] Worker {self.worker_id}: Executing {task.task_id}")
+        logger.info("[%.1f] Worker %d: Executing %s", self.now, self.worker_id, task.task_id)
 
-        # Do half the work
-        await self.timeout(task.duration / 2)
+        # Roll the spawn decision first (simulating divide-and-conquer):
+        # most tasks spawn nothing and can sleep once for the whole
+        # duration instead of paying two scheduler round-trips
+        if self.rng.random() < 0.3:  # 30% chance
+            # Do half the work before spawning, half after
+            half = task.duration * 0.5
+            await self.timeout(half)
 
-        # Randomly spawn child tasks (simulating divide-and-conquer)
-        if random.random() < 0.3:  # 30% chance
-            num_children = random.randint(1, 3)
-            for i in range(num_children):
-                child = Task(
-                    task_id=f"{task.task_id}.{i}",
-                    duration=random.uniform(0.3, 1.0),
+            num_children = self.rng.randint(1, 3)
+            # Build the dotted prefix once per brood; parent_id shares
+            # the existing id string rather than copying it
+            prefix = task.task_id + "."
+            children = [
+                Task.acquire(
+                    task_id=prefix + str(i),
+                    duration=self.rng.uniform(0.3, 1.0),
                     parent_id=task.task_id,
                 )
-                self.spawn_task(child)
+                for i in range(num_children)
+            ]
+            self.spawn_tasks(children)
 
-        # Finish the work
-        await self.timeout(task.duration / 2)
+            await self.timeout(half)
+        else:
+            await self.timeout(task.duration)
 
-        print(f"[{self.now:.1f}] Worker {self.worker_id}: Completed {task.task_id}")
+        logger.info("[%.1f] Worker %d: Completed %s", self.now, self.worker_id, task.task_id)
 
         self.current_task = None
 
-    def spawn_task(self, task: Task):
-        """Spawn a new task (called by executing task)."""
-        self.deque.push_bottom(task)
-        print(f"[{self.now:.1f}] Worker {self.worker_id}: Spawned {task.task_id}")
+    def spawn_tasks(self, tasks: list[Task]):
+        """Spawn a batch of tasks with one deque extend and one log line."""
+        self.deque.push_bottom_many(tasks)
+        for _ in tasks:
+            self.scheduler.wake_idle_worker()
+        logger.info(
+            "[%.1f] Worker %d: Spawned %d children of %s",
+            self.now,
+            self.worker_id,
+            len(tasks),
+            tasks[0].parent_id,
+        )
 
 
 # mccole: /spawner